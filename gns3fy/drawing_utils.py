@@ -2,7 +2,26 @@
 Functions used as helpers for drawing objects in a GNS3 Project.
 """
 
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 
+# Formatted with `%s`, which renders the values like the f-strings would
+_RECTANGLE_SVG = (
+    '<svg height="%s" width="%s"><rect fill="%s" fill-opacity="%s" height="%s" '
+    'stroke="%s" stroke-width="%s" width="%s" /></svg>'
+)
+_ELLIPSE_SVG = (
+    '<svg height="%s" width="%s"><ellipse cx="%s" cy="%s" fill="%s" '
+    'fill-opacity="%s" rx="%s" ry="%s" stroke="%s" stroke-width="%s" /></svg>'
+)
+_LINE_SVG = (
+    '<svg height="%s" width="%s"><line stroke="%s" stroke-width="%s" x1="%s" '
+    'x2="%s" y1="%s" y2="%s" /></svg>'
+)
+
+
+# The SVGs are usually generated with the same few shapes and colors
+@lru_cache(maxsize=512, typed=True)
 def generate_rectangle_svg(
     height: int = 100,
     width: int = 200,
@@ -11,13 +30,19 @@ def generate_rectangle_svg(
     stroke: str = "#000000",
     stroke_width: int = 2,
 ) -> str:
-    return (
-        f'<svg height="{height}" width="{width}"><rect fill="{fill}" fill-opacity="'
-        f'{fill_opacity}" height="{height}" stroke="{stroke}" stroke-width="'
-        f'{stroke_width}" width="{width}" /></svg>'
+    return _RECTANGLE_SVG % (
+        height,
+        width,
+        fill,
+        fill_opacity,
+        height,
+        stroke,
+        stroke_width,
+        width,
     )
 
 
+@lru_cache(maxsize=512, typed=True)
 def generate_ellipse_svg(
     height: float = 200.0,
     width: float = 200.0,
@@ -30,13 +55,21 @@ def generate_ellipse_svg(
     stroke: str = "#000000",
     stroke_width: int = 2,
 ) -> str:
-    return (
-        f'<svg height="{height}" width="{width}"><ellipse cx="{cx}" cy="{cy}" fill="'
-        f'{fill}" fill-opacity="{fill_opacity}" rx="{rx}" ry="{ry}" stroke="{stroke}" '
-        f'stroke-width="{stroke_width}" /></svg>'
+    return _ELLIPSE_SVG % (
+        height,
+        width,
+        cx,
+        cy,
+        fill,
+        fill_opacity,
+        rx,
+        ry,
+        stroke,
+        stroke_width,
     )
 
 
+@lru_cache(maxsize=512, typed=True)
 def generate_line_svg(
     height: int = 0,
     width: int = 200,
@@ -47,10 +80,7 @@ def generate_line_svg(
     stroke: str = "#000000",
     stroke_width: int = 2,
 ) -> str:
-    return (
-        f'<svg height="{height}" width="{width}"><line stroke="{stroke}" stroke-width="'
-        f'{stroke_width}" x1="{x1}" x2="{x2}" y1="{y1}" y2="{y2}" /></svg>'
-    )
+    return _LINE_SVG % (height, width, stroke, stroke_width, x1, x2, y1, y2)
 
 
 def parsed_x(x: int, obj_width: int = 100) -> int:
@@ -59,3 +89,12 @@ def parsed_x(x: int, obj_width: int = 100) -> int:
 
 def parsed_y(y: int, obj_height: int = 100) -> int:
     return (y * obj_height) * -1
+
+
+def parsed_xy(
+    xs: Iterable[int],
+    ys: Iterable[int],
+    obj_width: int = 100,
+    obj_height: int = 100,
+) -> Tuple[List[int], List[int]]:
+    return [x * obj_width for x in xs], [-(y * obj_height) for y in ys]
@@ -1,15 +1,60 @@
 import os
 import time
+import threading
 import requests
 from functools import wraps
+from operator import attrgetter, itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 from requests import HTTPError
-from dataclasses import field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dataclasses import field, fields, MISSING
 from typing import Optional, Any, Dict, List
 from pydantic import validator
 from pydantic.dataclasses import dataclass
 from math import pi, sin, cos
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _json_body(response):
+    "Decodes the JSON body of a response, using `orjson` when it is installed"
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _is_listed(item, items):
+    "Checks if `item` itself, not just an equal copy, is in the `items` list"
+    return any(_i is item for _i in items)
+
+
+def _endpoint_keys(link):
+    "Returns the `(node_id, adapter_number, port_number)` endpoints of a link"
+    return [
+        (_e["node_id"], _e["adapter_number"], _e["port_number"])
+        for _e in link.nodes or []
+    ]
+
+
+def _json_dumps(data):
+    """
+    Encodes a request body with `orjson`. Returns None when it is not installed or
+    cannot encode the data, so the body is left to `json`
+    """
+    if orjson is None:
+        return None
+    try:
+        # Non-string keys are converted to strings, as `json` does
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # For example integers wider than 64 bits, which `json` still encodes
+        return None
+
 
 class Config:
     validate_assignment = True
@@ -17,35 +62,81 @@ class Config:
     extra = "ignore"
 
 
-NODE_TYPES = [
-    "cloud",
-    "nat",
-    "ethernet_hub",
-    "ethernet_switch",
-    "frame_relay_switch",
-    "atm_switch",
-    "docker",
-    "dynamips",
-    "vpcs",
-    "traceng",
-    "virtualbox",
-    "vmware",
-    "iou",
-    "qemu",
-]
-
-CONSOLE_TYPES = [
-    "vnc",
-    "telnet",
-    "http",
-    "https",
-    "spice",
-    "spice+agent",
-    "none",
-    "null",
-]
-
-LINK_TYPES = ["ethernet", "serial"]
+NODE_TYPES = frozenset(
+    {
+        "cloud",
+        "nat",
+        "ethernet_hub",
+        "ethernet_switch",
+        "frame_relay_switch",
+        "atm_switch",
+        "docker",
+        "dynamips",
+        "vpcs",
+        "traceng",
+        "virtualbox",
+        "vmware",
+        "iou",
+        "qemu",
+    }
+)
+
+CONSOLE_TYPES = frozenset(
+    {
+        "vnc",
+        "telnet",
+        "http",
+        "https",
+        "spice",
+        "spice+agent",
+        "none",
+        "null",
+    }
+)
+
+LINK_TYPES = frozenset({"ethernet", "serial"})
+
+_NODE_STATUSES = frozenset({"stopped", "started", "suspended"})
+
+# Built-in nodes have no lifecycle, they always report themselves as started
+_BUILTIN_NODE_TYPES = frozenset(
+    {
+        "cloud",
+        "nat",
+        "ethernet_hub",
+        "ethernet_switch",
+        "frame_relay_switch",
+        "atm_switch",
+    }
+)
+
+# Status a node reports after each of its lifecycle actions
+_LIFECYCLE_STATUSES = {
+    "start": "started",
+    "stop": "stopped",
+    "reload": "started",
+    "suspend": "suspended",
+}
+
+# Line formatters of the nodes and links summaries
+_NODE_SUMMARY_LINE = "{}: {} -- Console: {} -- ID: {}".format
+_LINK_SUMMARY_LINE = "{}: {} ---- {}: {}".format
+
+
+# Retry policy of the sessions, shared since urllib3 copies it for each request
+_RETRY = Retry(
+    total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504), raise_on_status=False
+)
+
+_URLLIB3_WARNINGS_DISABLED = False
+
+
+def _disable_urllib3_warnings():
+    "Disables the urllib3 warnings, only the first time a connector is created"
+    global _URLLIB3_WARNINGS_DISABLED
+    if not _URLLIB3_WARNINGS_DISABLED:
+        requests.packages.urllib3.disable_warnings()
+        _URLLIB3_WARNINGS_DISABLED = True
 
 
 class Gns3Connector:
@@ -59,6 +150,13 @@ class Gns3Connector:
     - `cred` (str): Password used for authentication
     - `verify` (bool): Whether or not to verify SSL
     - `api_version` (int): GNS3 server REST API version
+    - `min_interval` (float): Minimum seconds between consecutive `http_calls`. By
+    default is `0`, meaning no rate limiting is applied
+    - `cache_ttl` (float): Seconds the version, templates and project IDs retrieved
+    from the server are reused before being fetched again. Set it to `0` to disable
+    the cache. Use `invalidate_cache()` to drop them at once
+    - `pool_maxsize` (int): Maximum connections kept open to the server. Raise it when
+    performing many concurrent operations
     - `api_calls`: Counter of amount of `http_calls` has been performed
     - `base_url`: url passed + api_version
     - `session`: Requests Session object
@@ -76,24 +174,160 @@ class Gns3Connector:
     ```
     """
 
-    def __init__(self, url=None, user=None, cred=None, verify=False, api_version=2):
-        requests.packages.urllib3.disable_warnings()
-        self.base_url = f"{url.strip('/')}/v{api_version}"
+    # Subclasses that need extra attributes get an instance __dict__ as usual
+    __slots__ = (
+        "_base_url",
+        "_projects_url",
+        "_templates_url",
+        "_computes_url",
+        "_project_urls",
+        "user",
+        "cred",
+        "verify",
+        "min_interval",
+        "api_calls",
+        "_last_call_ts",
+        "_lock",
+        "cache_ttl",
+        "pool_maxsize",
+        "_version_cache",
+        "_templates_cache",
+        "_templates_cache_ts",
+        "_templates_by_name",
+        "_templates_by_id",
+        "_project_ids_by_name",
+        "_project_ids_ts",
+        "session",
+    )
+
+    def __init__(
+        self,
+        url=None,
+        user=None,
+        cred=None,
+        verify=False,
+        api_version=2,
+        min_interval=0,
+        cache_ttl=30,
+        pool_maxsize=32,
+    ):
+        _disable_urllib3_warnings()
+        self.base_url = f"{url.rstrip('/')}/v{api_version}"
         self.user = user
         self.cred = cred
-        self.headers = {"Content-Type": "application/json"}
         self.verify = verify
+        self.min_interval = min_interval
         self.api_calls = 0
+        self._last_call_ts = 0.0
+        # Guards the throttling and the API calls counter between threads
+        self._lock = threading.Lock()
+        self.cache_ttl = cache_ttl
+        self.pool_maxsize = pool_maxsize
+        self._templates_cache = None
+        self._templates_cache_ts = 0.0
+        self._templates_by_name = {}
+        self._templates_by_id = {}
+        self._project_ids_by_name = {}
+        self._project_ids_ts = 0.0
 
         # Create session object
         self._create_session()
 
+    def __getstate__(self):
+        "Returns the attributes to copy or pickle, leaving out the thread lock"
+        _state = dict(getattr(self, "__dict__", {}))
+        for _slot in self.__slots__:
+            if _slot != "_lock" and hasattr(self, _slot):
+                _state[_slot] = getattr(self, _slot)
+        return _state
+
+    def __setstate__(self, state):
+        "Restores the copied or unpickled attributes, with a lock of its own"
+        for _name, _value in state.items():
+            object.__setattr__(self, _name, _value)
+        self._lock = threading.Lock()
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(
+        cls, url=None, user=None, cred=None, verify=False, api_version=2, **kwargs
+    ):
+        """
+        Returns a connector for the server, reusing the one created by a previous call
+        with the same arguments. This way the connection pool of its session is shared.
+
+        Create `Gns3Connector` instances directly when a separate session is needed.
+        """
+        _key = (
+            cls,
+            url,
+            user,
+            cred,
+            verify,
+            api_version,
+            tuple(sorted(kwargs.items())),
+        )
+        with cls._shared_lock:
+            _connector = cls._shared.get(_key)
+            if _connector is None:
+                _connector = cls._shared[_key] = cls(
+                    url=url,
+                    user=user,
+                    cred=cred,
+                    verify=verify,
+                    api_version=api_version,
+                    **kwargs,
+                )
+        return _connector
+
+    @property
+    def base_url(self):
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value):
+        self._base_url = value
+        self._projects_url = f"{value}/projects"
+        self._templates_url = f"{value}/templates"
+        self._computes_url = f"{value}/computes"
+        # URLs and lookups cached so far belong to the previous server
+        self._project_urls = {}
+        self._templates_cache = None
+        self._project_ids_by_name = {}
+        self._version_cache = None
+
+    def invalidate_cache(self):
+        """
+        Drops the version, templates and project IDs cached, so they are queried again
+        from the server on their next use
+        """
+        self._version_cache = None
+        self._invalidate_templates_cache()
+        self._invalidate_project_ids()
+
+    def _project_url(self, project_id):
+        "Returns the URL of the project endpoint, building it once per project"
+        _url = self._project_urls.get(project_id)
+        if _url is None:
+            _url = self._project_urls[project_id] = f"{self._projects_url}/{project_id}"
+        return _url
+
     def _create_session(self):
         """
         Creates the requests.Session object and applies the necessary parameters
         """
         self.session = requests.Session()  # pragma: no cover
-        self.session.headers["Accept"] = "application/json"  # pragma: no cover
+        # Reuse connections to the controller and retry on transient gateway errors
+        _adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=self.pool_maxsize, max_retries=_RETRY
+        )  # pragma: no cover
+        self.session.mount("http://", _adapter)  # pragma: no cover
+        self.session.mount("https://", _adapter)  # pragma: no cover
+        self.session.headers.update(
+            {"Accept": "application/json", "Connection": "keep-alive"}
+        )  # pragma: no cover
         if self.user:  # pragma: no cover
             self.session.auth = (self.user, self.cred)  # pragma: no cover
 
@@ -106,6 +340,7 @@ class Gns3Connector:
         headers=None,
         verify=False,
         params=None,
+        etag=None,
     ):
         """
         Performs the HTTP operation actioned
@@ -120,37 +355,72 @@ class Gns3Connector:
         - `headers`: ictionary of HTTP Headers to attach to the Request
         - `verify`: SSL Verification
         - `params`: Dictionary or bytes to be sent in the query string for the Request
-        """
+        - `etag`: ETag of the copy held by the caller. It is sent as `If-None-Match`,
+        so the server can answer with `304 Not Modified`
+        """
+        # Only throttle when a rate limit was explicitly requested
+        if self.min_interval:
+            # Reserve the next free slot, so concurrent calls keep their distance
+            with self._lock:
+                _now = time.monotonic()
+                _call_ts = max(_now, self._last_call_ts + self.min_interval)
+                self._last_call_ts = _call_ts
+            if _call_ts > _now:
+                time.sleep(_call_ts - _now)
+
+        _kwargs = {"params": params, "verify": verify}
         if data:
-            _response = getattr(self.session, method.lower())(
-                url, data=data, headers=headers, params=params, verify=verify
-            )
-
+            _kwargs["data"] = data
         elif json_data:
-            _response = getattr(self.session, method.lower())(
-                url, json=json_data, headers=headers, params=params, verify=verify
-            )
-
-        else:
-            _response = getattr(self.session, method.lower())(
-                url, headers=headers, params=params, verify=verify
-            )
-        self.api_calls += 1
-
-        try:
-            _response.raise_for_status()
-        except HTTPError:
-            raise HTTPError(
-                f"{_response.json()['status']}: {_response.json()['message']}"
-            )
+            _body = _json_dumps(json_data)
+            if _body is None:
+                _kwargs["json"] = json_data
+            else:
+                # Encoded with orjson instead of letting requests use json
+                _kwargs["data"] = _body
+                headers = dict(headers or {}, **{"Content-Type": "application/json"})
+        if etag:
+            headers = dict(headers or {}, **{"If-None-Match": etag})
+        if headers:
+            _kwargs["headers"] = headers
+
+        _response = self.session.request(method, url, **_kwargs)
+        with self._lock:
+            self.api_calls += 1
+
+        if _response.status_code >= 400:
+            try:
+                _error = _json_body(_response)
+                _message = f"{_error['status']}: {_error['message']}"
+            except (ValueError, KeyError, TypeError):
+                # Not a GNS3 error payload, like the ones of a proxy in between
+                _message = f"{_response.status_code}: {_response.text}"
+            raise HTTPError(_message)
 
         return _response
 
+    def http_call_json(self, method, url, **kwargs):
+        """
+        Performs the HTTP operation like `http_call` and returns the decoded JSON body
+        of the response. The body is decoded with `orjson` when it is installed.
+        """
+        return _json_body(self.http_call(method, url, **kwargs))
+
     def get_version(self):
         """
         Returns the version information of GNS3 server
+
+        **NOTE:** The result is cached for `cache_ttl` seconds
         """
-        return self.http_call("get", url=f"{self.base_url}/version").json()
+        if (
+            self._version_cache is None
+            or time.monotonic() - self._version_cache[0] >= self.cache_ttl
+        ):
+            self._version_cache = (
+                time.monotonic(),
+                self.http_call_json("get", url=f"{self.base_url}/version"),
+            )
+        return dict(self._version_cache[1])
 
     def projects_summary(self, is_print=True):
         """
@@ -162,9 +432,9 @@ class Gns3Connector:
         _projects_summary = []
         for _p in self.get_projects():
             # Retrieve the project stats
-            _stats = self.http_call(
-                "get", f"{self.base_url}/projects/{_p['project_id']}/stats"
-            ).json()
+            _stats = self.http_call_json(
+                "get", f"{self._project_url(_p['project_id'])}/stats"
+            )
             if is_print:
                 print(
                     f"{_p['name']}: {_p['project_id']} -- Nodes: {_stats['nodes']} -- "
@@ -186,7 +456,30 @@ class Gns3Connector:
         """
         Returns the list of the projects on the server
         """
-        return self.http_call("get", url=f"{self.base_url}/projects").json()
+        return self.http_call_json("get", url=self._projects_url)
+
+    def _project_id_cached(self, name):
+        "Checks if the ID of the project `name` is known and not expired"
+        return (
+            name in self._project_ids_by_name
+            and time.monotonic() - self._project_ids_ts < self.cache_ttl
+        )
+
+    def _lookup_project_id(self, name):
+        """
+        Resolves a project name to its ID. The `/projects` list is only queried when
+        the name is not known to the connector or was resolved over `cache_ttl` ago.
+        """
+        if not self._project_id_cached(name):
+            self._project_ids_by_name = {
+                _p["name"]: _p["project_id"] for _p in reversed(self.get_projects())
+            }
+            self._project_ids_ts = time.monotonic()
+        return self._project_ids_by_name.get(name)
+
+    def _invalidate_project_ids(self):
+        "Forces the next project name lookup to query the server"
+        self._project_ids_by_name = {}
 
     def get_project(self, name=None, project_id=None):
         """
@@ -197,15 +490,10 @@ class Gns3Connector:
         - `name` or `project_id`
         """
         if project_id:
-            return self.http_call(
-                "get", url=f"{self.base_url}/projects/{project_id}"
-            ).json()
+            return self.http_call_json("get", url=self._project_url(project_id))
         elif name:
-            try:
-                return next(p for p in self.get_projects() if p["name"] == name)
-            except StopIteration:
-                # Project not found
-                return None
+            # None when the project is not found
+            return next((p for p in self.get_projects() if p["name"] == name), None)
         else:
             raise ValueError("Must provide either a name or project_id")
 
@@ -218,12 +506,11 @@ class Gns3Connector:
         """
         _templates_summary = []
         for _t in self.get_templates():
-            if "console_type" not in _t:
-                _t["console_type"] = "N/A"
+            _console_type = _t.get("console_type", "N/A")
             if is_print:
                 print(
                     f"{_t['name']}: {_t['template_id']} -- Type: {_t['template_type']}"
-                    f" -- Builtin: {_t['builtin']} -- Console: {_t['console_type']} -- "
+                    f" -- Builtin: {_t['builtin']} -- Console: {_console_type} -- "
                     f"Category: {_t['category']}"
                 )
             _templates_summary.append(
@@ -232,18 +519,50 @@ class Gns3Connector:
                     _t["template_id"],
                     _t["template_type"],
                     _t["builtin"],
-                    _t["console_type"],
+                    _console_type,
                     _t["category"],
                 )
             )
 
         return _templates_summary if not is_print else None
 
+    def _templates_cache_valid(self):
+        "Checks if the cached templates can still be used"
+        return (
+            self._templates_cache is not None
+            and time.monotonic() - self._templates_cache_ts < self.cache_ttl
+        )
+
+    def _refresh_templates_cache(self):
+        "Retrieves the templates if the cache expired and indexes them by name and ID"
+        if self._templates_cache_valid():
+            return
+
+        _templates = self.http_call_json("get", url=self._templates_url)
+        # Reversed so the first template found wins on duplicated names
+        _by_name = {_t["name"]: _t for _t in reversed(_templates)}
+        _by_id = {_t["template_id"]: _t for _t in _templates}
+
+        # Indexes first and timestamp last, so other threads never see a valid cache
+        # with outdated indexes
+        self._templates_by_name = _by_name
+        self._templates_by_id = _by_id
+        self._templates_cache = _templates
+        self._templates_cache_ts = time.monotonic()
+
+    def _invalidate_templates_cache(self):
+        "Forces the next templates lookup to query the server"
+        self._templates_cache = None
+
     def get_templates(self):
         """
         Returns the templates defined on the server.
+
+        **NOTE:** The result is cached for `cache_ttl` seconds
         """
-        return self.http_call("get", url=f"{self.base_url}/templates").json()
+        self._refresh_templates_cache()
+        # Copies, so callers cannot alter the cached templates
+        return [dict(_t) for _t in self._templates_cache]
 
     def get_template(self, name=None, template_id=None):
         """
@@ -254,15 +573,16 @@ class Gns3Connector:
         - `name` or `template_id`
         """
         if template_id:
-            return self.http_call(
-                "get", url=f"{self.base_url}/templates/{template_id}"
-            ).json()
+            if self._templates_cache_valid() and template_id in self._templates_by_id:
+                return dict(self._templates_by_id[template_id])
+            return self.http_call_json(
+                "get", url=f"{self._templates_url}/{template_id}"
+            )
         elif name:
-            try:
-                return next(t for t in self.get_templates() if t["name"] == name)
-            except StopIteration:
-                # Template name not found
-                return None
+            self._refresh_templates_cache()
+            _template = self._templates_by_name.get(name)
+            # Returns None if the template name is not found
+            return dict(_template) if _template is not None else None
         else:
             raise ValueError("Must provide either a name or template_id")
 
@@ -276,16 +596,18 @@ class Gns3Connector:
 
         - `name` or `template_id`
         """
-        _template = self.get_template(name=name, template_id=template_id)
+        # Copy it so the cached template is not altered
+        _template = dict(self.get_template(name=name, template_id=template_id))
         _template.update(**kwargs)
 
-        response = self.http_call(
+        response = self.http_call_json(
             "put",
-            url=f"{self.base_url}/templates/{_template['template_id']}",
+            url=f"{self._templates_url}/{_template['template_id']}",
             json_data=_template,
         )
+        self._invalidate_templates_cache()
 
-        return response.json()
+        return response
 
     def create_template(self, **kwargs):
         """
@@ -306,11 +628,12 @@ class Gns3Connector:
         if "compute_id" not in kwargs:
             kwargs["compute_id"] = "local"
 
-        response = self.http_call(
-            "post", url=f"{self.base_url}/templates", json_data=kwargs
+        response = self.http_call_json(
+            "post", url=self._templates_url, json_data=kwargs
         )
+        self._invalidate_templates_cache()
 
-        return response.json()
+        return response
 
     def delete_template(self, name=None, template_id=None):
         """
@@ -326,7 +649,8 @@ class Gns3Connector:
             _template = self.get_template(name=name)
             template_id = _template["template_id"]
 
-        self.http_call("delete", url=f"{self.base_url}/templates/{template_id}")
+        self.http_call("delete", url=f"{self._templates_url}/{template_id}")
+        self._invalidate_templates_cache()
 
     def get_nodes(self, project_id):
         """
@@ -336,9 +660,7 @@ class Gns3Connector:
 
         - `project_id`
         """
-        return self.http_call(
-            "get", url=f"{self.base_url}/projects/{project_id}/nodes"
-        ).json()
+        return self.http_call_json("get", url=f"{self._project_url(project_id)}/nodes")
 
     def get_node(self, project_id, node_id):
         """
@@ -349,8 +671,8 @@ class Gns3Connector:
         - `project_id`
         - `node_id`
         """
-        _url = f"{self.base_url}/projects/{project_id}/nodes/{node_id}"
-        return self.http_call("get", _url).json()
+        _url = f"{self._project_url(project_id)}/nodes/{node_id}"
+        return self.http_call_json("get", _url)
 
     def get_links(self, project_id):
         """
@@ -360,9 +682,7 @@ class Gns3Connector:
 
         - `project_id`
         """
-        return self.http_call(
-            "get", url=f"{self.base_url}/projects/{project_id}/links"
-        ).json()
+        return self.http_call_json("get", url=f"{self._project_url(project_id)}/links")
 
     def get_link(self, project_id, link_id):
         """
@@ -373,8 +693,8 @@ class Gns3Connector:
         - `project_id`
         - `link_id`
         """
-        _url = f"{self.base_url}/projects/{project_id}/links/{link_id}"
-        return self.http_call("get", _url).json()
+        _url = f"{self._project_url(project_id)}/links/{link_id}"
+        return self.http_call_json("get", _url)
 
     def create_project(self, **kwargs):
         """
@@ -388,10 +708,12 @@ class Gns3Connector:
 
         JSON project information
         """
-        _url = f"{self.base_url}/projects"
+        _url = self._projects_url
         if "name" not in kwargs:
             raise ValueError("Parameter 'name' is mandatory")
-        return self.http_call("post", _url, json_data=kwargs).json()
+        _response = self.http_call_json("post", _url, json_data=kwargs)
+        self._invalidate_project_ids()
+        return _response
 
     def delete_project(self, project_id):
         """
@@ -401,8 +723,9 @@ class Gns3Connector:
 
         - `project_id`
         """
-        _url = f"{self.base_url}/projects/{project_id}"
+        _url = self._project_url(project_id)
         self.http_call("delete", _url)
+        self._invalidate_project_ids()
         return
 
     def get_computes(self):
@@ -413,8 +736,8 @@ class Gns3Connector:
 
         List of dictionaries of the computes attributes like cpu/memory usage
         """
-        _url = f"{self.base_url}/computes"
-        return self.http_call("get", _url).json()
+        _url = self._computes_url
+        return self.http_call_json("get", _url)
 
     def get_compute(self, compute_id="local"):
         """
@@ -424,8 +747,8 @@ class Gns3Connector:
 
         Dictionary of the compute attributes like cpu/memory usage
         """
-        _url = f"{self.base_url}/computes/{compute_id}"
-        return self.http_call("get", _url).json()
+        _url = f"{self._computes_url}/{compute_id}"
+        return self.http_call_json("get", _url)
 
     def get_compute_images(self, emulator, compute_id="local"):
         """
@@ -441,8 +764,8 @@ class Gns3Connector:
         List of dictionaries with images available for the compute for the specified
         emulator
         """
-        _url = f"{self.base_url}/computes/{compute_id}/{emulator}/images"
-        return self.http_call("get", _url).json()
+        _url = f"{self._computes_url}/{compute_id}/{emulator}/images"
+        return self.http_call_json("get", _url)
 
     def upload_compute_image(self, emulator, file_path, compute_id="local"):
         """
@@ -458,8 +781,11 @@ class Gns3Connector:
             raise FileNotFoundError(f"Could not find file: {file_path}")
 
         _filename = os.path.basename(file_path)
-        _url = f"{self.base_url}/computes/{compute_id}/{emulator}/images/{_filename}"
-        self.http_call("post", _url, data=open(file_path, "rb"))
+        _url = f"{self._computes_url}/{compute_id}/{emulator}/images/{_filename}"
+        # The file is streamed from disk and closed even if the upload fails
+        _headers = {"Content-Length": str(os.path.getsize(file_path))}
+        with open(file_path, "rb") as _image:
+            self.http_call("post", _url, data=_image, headers=_headers)
 
     def get_compute_ports(self, compute_id="local"):
         """
@@ -473,8 +799,106 @@ class Gns3Connector:
 
         Dictionary of `console_ports` used and range, as well as the `udp_ports`
         """
-        _url = f"{self.base_url}/computes/{compute_id}/ports"
-        return self.http_call("get", _url).json()
+        _url = f"{self._computes_url}/{compute_id}/ports"
+        return self.http_call_json("get", _url)
+
+
+class _ApiObject:
+    """
+    Shared helpers for the GNS3 API objects. The field names of each object are
+    compiled once when the class is defined, so updating from an API response or
+    building a `create` payload does not need to walk the instance `__dict__`.
+    """
+
+    _CREATE_EXCLUDES = frozenset({"connector"})
+    # Allowed values checked when building an object straight from a server payload
+    _SERVER_CHECKS = {}
+    # Endpoint path of the object inside its project, filled from its attributes
+    _URL_PATH = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _annotations = cls.__dict__.get("__annotations__")
+        if _annotations:
+            cls._FIELDS = frozenset(_annotations)
+            cls._CREATE_FIELDS = tuple(
+                k for k in _annotations if k not in cls._CREATE_EXCLUDES
+            )
+
+    @property
+    def _url(self):
+        "URL of the object endpoint on the server"
+        _path = self._URL_PATH.format_map(self.__dict__)
+        return f"{self.connector._project_url(self.project_id)}{_path}"
+
+    def _update(self, data_dict):
+        """
+        Applies a payload returned by the GNS3 server in a single step. Like in
+        `_from_server`, only the fields listed under `_SERVER_CHECKS` are checked.
+        """
+        _values = {k: data_dict[k] for k in data_dict.keys() & self._FIELDS}
+        self._check_server_values(_values)
+        self.__dict__.update(_values)
+
+    def _create_data(self):
+        data = {}
+        for k in self._CREATE_FIELDS:
+            v = getattr(self, k)
+            if v is not None:
+                data[k] = v
+        return data
+
+    @classmethod
+    def _field_defaults(cls):
+        if "_DEFAULTS" not in cls.__dict__:
+            cls._DEFAULTS = tuple(
+                (_f.name, _f.default, _f.default_factory) for _f in fields(cls)
+            )
+        return cls._DEFAULTS
+
+    @classmethod
+    def _check_server_values(cls, values):
+        "Sanity checks the `_SERVER_CHECKS` fields present in `values`"
+        for k, _allowed in cls._SERVER_CHECKS.items():
+            _value = values.get(k)
+            if _value is not None and _value not in _allowed:
+                raise ValueError(f"Not a valid {k} - {_value}")
+
+    @classmethod
+    def _from_server(cls, connector, data, **extra):
+        """
+        Builds the object from a payload returned by the GNS3 server without running
+        the pydantic validators, since the server already produced valid data. Only
+        the fields listed under `_SERVER_CHECKS` are sanity checked. The `extra`
+        fields given take precedence over the payload.
+        """
+        _values = {}
+        for _name, _default, _factory in cls._field_defaults():
+            if _name in data:
+                _values[_name] = data[_name]
+            elif _factory is not MISSING:
+                _values[_name] = _factory()
+            else:
+                _values[_name] = None if _default is MISSING else _default
+        _values["connector"] = connector
+        _values.update(extra)
+        cls._check_server_values(_values)
+
+        _obj = object.__new__(cls)
+        _obj.__dict__.update(_values)
+        # Flag the object as initialised so assignments are validated as usual
+        object.__setattr__(_obj, "__pydantic_initialised__", True)
+        object.__setattr__(_obj, "__initialised__", True)
+        return _obj
+
+
+def _index_links_by_node(links):
+    "Maps each node ID to the list of `Link` objects it is an endpoint of"
+    _links_by_node = {}
+    for _link in links:
+        for _endpoint in _link.nodes or []:
+            _links_by_node.setdefault(_endpoint["node_id"], []).append(_link)
+    return _links_by_node
 
 
 def verify_connector_and_id(f):
@@ -490,25 +914,23 @@ def verify_connector_and_id(f):
         if not self.project_id:
             raise ValueError("Need to submit project_id")
         # Checks for Node
-        if self.__class__.__name__ == "Node":
+        if isinstance(self, Node):
             if not self.node_id:
                 if not self.name:
                     raise ValueError("Need to either submit node_id or name")
 
                 # Try to retrieve the node_id
-                _url = f"{self.connector.base_url}/projects/{self.project_id}/nodes"
-                _response = self.connector.http_call("get", _url)
+                _url = f"{self.connector._project_url(self.project_id)}/nodes"
+                _response = self.connector.http_call_json("get", _url)
 
-                extracted = [
-                    node for node in _response.json() if node["name"] == self.name
-                ]
+                extracted = [node for node in _response if node["name"] == self.name]
                 if len(extracted) > 1:  # pragma: no cover
                     raise ValueError(
                         "Multiple nodes found with same name. Need to submit node_id"
                     )
                 self.node_id = extracted[0]["node_id"]
         # Checks for Link
-        if self.__class__.__name__ == "Link":
+        elif isinstance(self, Link):
             if not self.link_id:
                 raise ValueError("Need to submit link_id")
         return f(self, *args, **kwargs)
@@ -517,7 +939,7 @@ def verify_connector_and_id(f):
 
 
 @dataclass(config=Config)
-class Link:
+class Link(_ApiObject):
     """
     GNS3 Link API object. For more information visit: [Links Endpoint API information](
     http://api.gns3.net/en/2.2/api/v2/controller/link/projectsprojectidlinks.html)
@@ -554,6 +976,9 @@ class Link:
     ```
     """
 
+    _SERVER_CHECKS = {"link_type": LINK_TYPES}
+    _URL_PATH = "/links/{link_id}"
+
     link_id: Optional[str] = None
     link_type: Optional[str] = None
     link_style: Optional[Any] = None
@@ -586,11 +1011,6 @@ class Link:
             raise ValueError(f"Not a valid filters - {value}")
         return value
 
-    def _update(self, data_dict):
-        for k, v in data_dict.items():
-            if k in self.__dict__.keys():
-                self.__setattr__(k, v)
-
     @verify_connector_and_id
     def get(self):
         """
@@ -602,13 +1022,11 @@ class Link:
         - `connector`
         - `link_id`
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/links/{self.link_id}"
-        )
-        _response = self.connector.http_call("get", _url)
+        _url = self._url
+        _response = self.connector.http_call_json("get", _url)
 
         # Update object
-        self._update(_response.json())
+        self._update(_response)
 
     @verify_connector_and_id
     def delete(self):
@@ -622,9 +1040,7 @@ class Link:
         - `connector`
         - `link_id`
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/links/{self.link_id}"
-        )
+        _url = self._url
 
         self.connector.http_call("delete", _url)
 
@@ -646,19 +1062,14 @@ class Link:
         if not self.project_id:
             raise ValueError("Need to submit project_id")
 
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/links"
+        _url = f"{self.connector._project_url(self.project_id)}/links"
 
-        data = {
-            k: v
-            for k, v in self.__dict__.items()
-            if k not in ("connector", "__initialised__", "__pydantic_initialised__")
-            if v is not None
-        }
+        data = self._create_data()
 
-        _response = self.connector.http_call("post", _url, json_data=data)
+        _response = self.connector.http_call_json("post", _url, json_data=data)
 
         # Now update it
-        self._update(_response.json())
+        self._update(_response)
 
     @verify_connector_and_id
     def update(self, **kwargs):
@@ -680,19 +1091,17 @@ class Link:
         - `connector`
         - `link_id`
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/links/{self.link_id}"
-        )
+        _url = self._url
 
         # TODO: Verify that the passed kwargs are supported ones
-        _response = self.connector.http_call("put", _url, json_data=kwargs)
+        _response = self.connector.http_call_json("put", _url, json_data=kwargs)
 
         # Update object
-        self._update(_response.json())
+        self._update(_response)
 
 
 @dataclass(config=Config)
-class Node:
+class Node(_ApiObject):
     """
     GNS3 Node API object. For more information visit: [Node Endpoint API information](
     http://api.gns3.net/en/2.2/api/v2/controller/node/projectsprojectidnodes.html)
@@ -746,6 +1155,12 @@ class Node:
     ```
     """
 
+    _CREATE_EXCLUDES = frozenset(
+        {"project_id", "template", "template_id", "links", "connector"}
+    )
+    _SERVER_CHECKS = {"node_type": NODE_TYPES}
+    _URL_PATH = "/nodes/{node_id}"
+
     name: Optional[str] = None
     project_id: Optional[str] = None
     node_id: Optional[str] = None
@@ -792,36 +1207,44 @@ class Node:
 
     @validator("status")
     def _valid_status(cls, value):
-        if value not in ("stopped", "started", "suspended") and value is not None:
+        if value not in _NODE_STATUSES and value is not None:
             raise ValueError(f"Not a valid status - {value}")
         return value
 
-    def _update(self, data_dict):
-        for k, v in data_dict.items():
-            if k in self.__dict__.keys():
-                self.__setattr__(k, v)
+    def _port_by_name(self, name):
+        "Returns the port named `name`, indexing the ports once per `ports` list"
+        _cached = self.__dict__.get("_ports_by_name")
+        if _cached is None or _cached[0] is not self.ports:
+            _cached = self.__dict__["_ports_by_name"] = (
+                self.ports,
+                {_p["name"]: _p for _p in reversed(self.ports or [])},
+            )
+        return _cached[1].get(name)
 
     @verify_connector_and_id
-    def get(self, get_links=True):
+    def get(self, get_links=True, prefetched_links=None):
         """
         Retrieves the node information. When `get_links` is `True` it also retrieves the
         links respective to the node.
 
+        - `prefetched_links`: List of the project `Link` objects (like `Project.links`).
+        When given, the node links are taken from it instead of querying the server
+
         **Required Attributes:**
 
         - `project_id`
         - `connector`
         - `node_id`
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/nodes/{self.node_id}"
-        )
-        _response = self.connector.http_call("get", _url)
+        _url = self._url
+        _response = self.connector.http_call_json("get", _url)
 
         # Update object
-        self._update(_response.json())
+        self._update(_response)
 
-        if get_links:
+        if prefetched_links is not None:
+            self.links = _index_links_by_node(prefetched_links).get(self.node_id, [])
+        elif get_links:
             self.get_links()
 
     @verify_connector_and_id
@@ -836,109 +1259,90 @@ class Node:
         - `connector`
         - `node_id`
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/nodes"
-            f"/{self.node_id}/links"
-        )
-        _response = self.connector.http_call("get", _url)
+        _url = f"{self._url}/links"
+        _response = self.connector.http_call_json("get", _url)
+
+        # The links are built from server data, so skip validating the list again
+        self.__dict__["links"] = [
+            Link._from_server(self.connector, _link) for _link in _response
+        ]
+
+    def _lifecycle(self, action, skip_get_on_mismatch):
+        """
+        Performs the `action` (start, stop, reload or suspend) on the node, and updates
+        it or queries it again if the status is not the expected one
+        """
+        _data = self.connector.http_call_json("post", f"{self._url}/{action}")
 
-        # Create the Link array but cleanup cache if there is one
-        if self.links:
-            self.links = []
-        for _link in _response.json():
-            self.links.append(Link(connector=self.connector, **_link))
+        # Update object and perform get if change was not reflected
+        self._update(_data)
+        _expected = _LIFECYCLE_STATUSES[action]
+        if _data.get("status") != _expected and not skip_get_on_mismatch:
+            self.get(get_links=False)  # pragma: no cover
 
     @verify_connector_and_id
-    def start(self):
+    def start(self, skip_get_on_mismatch=False):
         """
         Starts the node.
 
+        - `skip_get_on_mismatch`: When `True` the node is not queried again if the
+        response does not reflect the new status yet (useful for bulk operations)
+
         **Required Attributes:**
 
         - `project_id`
         - `connector`
         - `node_id`
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/nodes"
-            f"/{self.node_id}/start"
-        )
-        _response = self.connector.http_call("post", _url)
-
-        # Update object or perform get if change was not reflected
-        if _response.json().get("status") == "started":
-            self._update(_response.json())
-        else:
-            self.get()  # pragma: no cover
+        self._lifecycle("start", skip_get_on_mismatch)
 
     @verify_connector_and_id
-    def stop(self):
+    def stop(self, skip_get_on_mismatch=False):
         """
         Stops the node.
 
+        - `skip_get_on_mismatch`: When `True` the node is not queried again if the
+        response does not reflect the new status yet (useful for bulk operations)
+
         **Required Attributes:**
 
         - `project_id`
         - `connector`
         - `node_id`
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/nodes"
-            f"/{self.node_id}/stop"
-        )
-        _response = self.connector.http_call("post", _url)
-
-        # Update object or perform get if change was not reflected
-        if _response.json().get("status") == "stopped":
-            self._update(_response.json())
-        else:
-            self.get()  # pragma: no cover
+        self._lifecycle("stop", skip_get_on_mismatch)
 
     @verify_connector_and_id
-    def reload(self):
+    def reload(self, skip_get_on_mismatch=False):
         """
         Reloads the node.
 
+        - `skip_get_on_mismatch`: When `True` the node is not queried again if the
+        response does not reflect the new status yet (useful for bulk operations)
+
         **Required Attributes:**
 
         - `project_id`
         - `connector`
         - `node_id`
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/nodes"
-            f"/{self.node_id}/reload"
-        )
-        _response = self.connector.http_call("post", _url)
-
-        # Update object or perform get if change was not reflected
-        if _response.json().get("status") == "started":
-            self._update(_response.json())
-        else:
-            self.get()  # pragma: no cover
+        self._lifecycle("reload", skip_get_on_mismatch)
 
     @verify_connector_and_id
-    def suspend(self):
+    def suspend(self, skip_get_on_mismatch=False):
         """
         Suspends the node.
 
+        - `skip_get_on_mismatch`: When `True` the node is not queried again if the
+        response does not reflect the new status yet (useful for bulk operations)
+
         **Required Attributes:**
 
         - `project_id`
         - `connector`
         - `node_id`
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/nodes"
-            f"/{self.node_id}/suspend"
-        )
-        _response = self.connector.http_call("post", _url)
-
-        # Update object or perform get if change was not reflected
-        if _response.json().get("status") == "suspended":
-            self._update(_response.json())
-        else:
-            self.get()  # pragma: no cover
+        self._lifecycle("suspend", skip_get_on_mismatch)
 
     @verify_connector_and_id
     def update(self, **kwargs):
@@ -959,15 +1363,13 @@ class Node:
         - `project_id`
         - `connector`
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/nodes/{self.node_id}"
-        )
+        _url = self._url
 
         # TODO: Verify that the passed kwargs are supported ones
-        _response = self.connector.http_call("put", _url, json_data=kwargs)
+        _response = self.connector.http_call_json("put", _url, json_data=kwargs)
 
         # Update object
-        self._update(_response.json())
+        self._update(_response)
 
     def create(self):
         """
@@ -995,38 +1397,22 @@ class Node:
                 _template = self.connector.get_template(name=self.template)
                 if _template is None:
                     raise ValueError(f"Template {self.template} not found")
-                self.template_id = self.connector.get_template(name=self.template).get(
-                    "template_id"
-                )
+                self.template_id = _template.get("template_id")
             else:
                 raise ValueError("Need either 'template' of 'template_id'")
 
-        cached_data = {
-            k: v
-            for k, v in self.__dict__.items()
-            if k
-            not in (
-                "project_id",
-                "template",
-                "template_id",
-                "links",
-                "connector",
-                "__initialised__",
-                "__pydantic_initialised__",
-            )
-            if v is not None
-        }
+        cached_data = self._create_data()
 
         _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/"
-            f"templates/{self.template_id}"
+            f"{self.connector._project_url(self.project_id)}"
+            f"/templates/{self.template_id}"
         )
 
-        _response = self.connector.http_call(
+        _response = self.connector.http_call_json(
             "post", _url, json_data=dict(x=0, y=0, compute_id=self.compute_id)
         )
 
-        self._update(_response.json())
+        self._update(_response)
 
         # Update the node attributes based on cached data
         self.update(**cached_data)
@@ -1043,9 +1429,7 @@ class Node:
         - `connector`
         - `node_id`
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/nodes/{self.node_id}"
-        )
+        _url = self._url
 
         self.connector.http_call("delete", _url)
 
@@ -1064,10 +1448,7 @@ class Node:
         - `connector`
         - `path`: Node's relative path of the file
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/nodes/{self.node_id}"
-            f"/files/{path}"
-        )
+        _url = f"{self._url}/files/{path}"
 
         return self.connector.http_call("get", _url).text
 
@@ -1095,16 +1476,13 @@ class Node:
         - `path`: Node's relative path of the file
         - `data`: Data to be included in the file
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/nodes/{self.node_id}"
-            f"/files/{path}"
-        )
+        _url = f"{self._url}/files/{path}"
 
         self.connector.http_call("post", _url, data=data)
 
 
 @dataclass(config=Config)
-class Project:
+class Project(_ApiObject):
     """
     GNS3 Project API object. For more information visit: [Project Endpoint API
     information](http://api.gns3.net/en/2.2/api/v2/controller/project/projects.html)
@@ -1150,6 +1528,8 @@ class Project:
     ```
     """
 
+    _CREATE_EXCLUDES = frozenset({"stats", "nodes", "links", "connector"})
+
     name: Optional[str] = None
     project_id: Optional[str] = None
     status: Optional[str] = None
@@ -1183,11 +1563,6 @@ class Project:
             raise ValueError("status must be opened or closed")
         return value
 
-    def _update(self, data_dict):
-        for k, v in data_dict.items():
-            if k in self.__dict__.keys():
-                self.__setattr__(k, v)
-
     def get(self, get_links=True, get_nodes=True, get_stats=True):
         """
         Retrieves the projects information.
@@ -1208,36 +1583,47 @@ class Project:
         if not self.connector:
             raise ValueError("Gns3Connector not assigned under 'connector'")
 
-        # Get projects if no ID was provided by the name
+        # Resolve the ID from the name if it was not provided
+        _cached_id = False
         if not self.project_id:
             if not self.name:
                 raise ValueError("Need to submit either project_id or name")
-            _url = f"{self.connector.base_url}/projects"
-            # Get all projects and filter the respective project
-            _response = self.connector.http_call("get", _url)
-
-            # Filter the respective project
-            for _project in _response.json():
-                if _project.get("name") == self.name:
-                    self.project_id = _project.get("project_id")
+            _cached_id = self.connector._project_id_cached(self.name)
+            self.project_id = self.connector._lookup_project_id(self.name)
 
         # Get project
-        _url = f"{self.connector.base_url}/projects/{self.project_id}"
-        _response = self.connector.http_call("get", _url)
+        _url = self._url
+        try:
+            _response = self.connector.http_call_json("get", _url)
+        except HTTPError:
+            if not _cached_id:
+                raise
+            # The cached ID may belong to a project removed by another client
+            self.connector._invalidate_project_ids()
+            self.project_id = self.connector._lookup_project_id(self.name)
+            _url = self._url
+            _response = self.connector.http_call_json("get", _url)
 
         # Update object
-        self._update(_response.json())
-
-        if get_stats:
-            self.get_stats()
-            if self.stats.get("snapshots", 0) > 0:
-                self.get_snapshots()
-            if self.stats.get("drawings", 0) > 0:
-                self.get_drawings()
-        if get_nodes:
-            self.get_nodes()
-        if get_links:
-            self.get_links()
+        self._update(_response)
+
+        if not get_stats:
+            self._get_nodes_and_links(get_nodes=get_nodes, get_links=get_links)
+            return
+
+        # The stats (with snapshots and drawings) are independent from the topology
+        with ThreadPoolExecutor(max_workers=1) as _executor:
+            _stats = _executor.submit(self._get_stats_and_extras)
+            self._get_nodes_and_links(get_nodes=get_nodes, get_links=get_links)
+            _stats.result()
+
+    def _get_stats_and_extras(self):
+        "Retrieves the stats, and the snapshots and drawings if the project has any"
+        self.get_stats()
+        if self.stats.get("snapshots", 0) > 0:
+            self.get_snapshots()
+        if self.stats.get("drawings", 0) > 0:
+            self.get_drawings()
 
     def create(self):
         """
@@ -1253,27 +1639,14 @@ class Project:
         if not self.connector:
             raise ValueError("Gns3Connector not assigned under 'connector'")
 
-        _url = f"{self.connector.base_url}/projects"
-
-        data = {
-            k: v
-            for k, v in self.__dict__.items()
-            if k
-            not in (
-                "stats",
-                "nodes",
-                "links",
-                "connector",
-                "__initialised__",
-                "__pydantic_initialised__",
-            )
-            if v is not None
-        }
+        _url = self.connector._projects_url
 
-        _response = self.connector.http_call("post", _url, json_data=data)
+        data = self._create_data()
+
+        _response = self.connector.http_call_json("post", _url, json_data=data)
 
         # Now update it
-        self._update(_response.json())
+        self._update(_response)
 
     @verify_connector_and_id
     def update(self, **kwargs):
@@ -1294,13 +1667,15 @@ class Project:
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}"
+        _url = self._url
 
         # TODO: Verify that the passed kwargs are supported ones
-        _response = self.connector.http_call("put", _url, json_data=kwargs)
+        _response = self.connector.http_call_json("put", _url, json_data=kwargs)
+        if "name" in kwargs:
+            self.connector._invalidate_project_ids()
 
         # Update object
-        self._update(_response.json())
+        self._update(_response)
 
     @verify_connector_and_id
     def delete(self):
@@ -1313,9 +1688,10 @@ class Project:
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}"
+        _url = self._url
 
         self.connector.http_call("delete", _url)
+        self.connector._invalidate_project_ids()
 
         self.project_id = None
         self.name = None
@@ -1330,7 +1706,7 @@ class Project:
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/close"
+        _url = f"{self._url}/close"
 
         _response = self.connector.http_call("post", _url)
 
@@ -1348,12 +1724,12 @@ class Project:
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/open"
+        _url = f"{self._url}/open"
 
-        _response = self.connector.http_call("post", _url)
+        _response = self.connector.http_call_json("post", _url)
 
         # Update object
-        self._update(_response.json())
+        self._update(_response)
 
     @verify_connector_and_id
     def get_stats(self):
@@ -1365,12 +1741,10 @@ class Project:
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/stats"
-
-        _response = self.connector.http_call("get", _url)
-
+        _url = f"{self._url}/stats"
         # Update object
-        self.stats = _response.json()
+
+        self.stats = self.connector.http_call_json("get", _url)
 
     @verify_connector_and_id
     def get_file(self, path):
@@ -1384,7 +1758,7 @@ class Project:
         - `connector`
         - `path`: Project's relative path of the file
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/files/{path}"
+        _url = f"{self._url}/files/{path}"
 
         return self.connector.http_call("get", _url).text
 
@@ -1411,137 +1785,254 @@ class Project:
         - `path`: Project's relative path of the file
         - `data`: Data to be included in the file
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/files/{path}"
+        _url = f"{self._url}/files/{path}"
 
         self.connector.http_call("post", _url, data=data)
 
     @verify_connector_and_id
-    def get_nodes(self):
+    def get_nodes(self, get_links=False):
         """
         Retrieve the nodes of the project.
 
+        - `get_links`: When true it also retrieves the links of the project and assigns
+        them to their respective nodes, using a single query for all the nodes
+
         **Required Attributes:**
 
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/nodes"
+        _nodes_data, _etag = self._fetch("nodes")
+        if _nodes_data is not None:
+            self._load_nodes(_nodes_data, _etag)
 
-        _response = self.connector.http_call("get", _url)
+        if get_links and self.nodes:
+            self.get_links()
 
-        # Create the Nodes array but cleanup cache if there is one
-        if self.nodes:
-            self.nodes = []
-        for _node in _response.json():
-            _n = Node(connector=self.connector, **_node)
-            _n.project_id = self.project_id
-            self.nodes.append(_n)
+    def _fetch(self, kind):
+        """
+        Queries the `nodes`, `links` or `drawings` of the project and returns the data
+        with its ETag. The data is `None` when the server reports that the list
+        currently held was not modified.
+        """
+        _items = getattr(self, kind)
+        _cached = self.__dict__.get("_etags", {}).get(kind)
+        _etag = None
+        if _cached and _cached[1] is _items and _cached[2] == len(_items):
+            _etag = _cached[0]
+
+        _response = self.connector.http_call("get", f"{self._url}/{kind}", etag=_etag)
+        if _response.status_code == 304:
+            return None, _etag
+        return _json_body(_response), _response.headers.get("ETag")
+
+    def _remember_etag(self, kind, etag):
+        "Records the ETag of the `nodes`, `links` or `drawings` list just loaded"
+        _items = getattr(self, kind)
+        self.__dict__.setdefault("_etags", {})[kind] = (etag, _items, len(_items))
+
+    def _load_nodes(self, nodes_data, etag=None):
+        "Replaces the `nodes` attribute with the nodes returned by the server"
+        self._topology_changed()
+        # The nodes are built from server data, so skip validating the list again
+        self.__dict__["nodes"] = [
+            Node._from_server(self.connector, _node, project_id=self.project_id)
+            for _node in nodes_data
+        ]
+        self._remember_etag("nodes", etag)
 
     @verify_connector_and_id
     def get_links(self):
         """
-        Retrieve the links of the project.
+        Retrieve the links of the project. The links are also assigned to the `links`
+        attribute of the respective nodes already retrieved.
 
         **Required Attributes:**
 
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/links"
+        _links_data, _etag = self._fetch("links")
+        if _links_data is not None:
+            self._load_links(_links_data, _etag)
+        else:
+            self._assign_node_links()
 
-        _response = self.connector.http_call("get", _url)
+    def _load_links(self, links_data, etag=None):
+        """
+        Replaces the `links` attribute with the links returned by the server, and
+        assigns them to the respective nodes already retrieved
+        """
+        self._topology_changed()
+        # The links are built from server data, so skip validating the list again
+        self.__dict__["links"] = [
+            Link._from_server(self.connector, _link, project_id=self.project_id)
+            for _link in links_data
+        ]
+        self._remember_etag("links", etag)
+        self._assign_node_links()
 
-        # Create the Nodes array but cleanup cache if there is one
-        if self.links:
-            self.links = []
-        for _link in _response.json():
-            _l = Link(connector=self.connector, **_link)
-            _l.project_id = self.project_id
-            self.links.append(_l)
+    def _assign_node_links(self):
+        "Assigns the project links to the `links` attribute of their nodes"
+        if self.nodes:
+            _links_by_node = _index_links_by_node(self.links)
+            for _n in self.nodes:
+                _n.links = _links_by_node.get(_n.node_id, [])
+
+    def _refresh_node_statuses(self):
+        """
+        Queries the nodes of the project and updates the `status` of the nodes already
+        retrieved in place. The nodes are reloaded when they don't match the server.
+        """
+        _nodes_data, _etag = self._fetch("nodes")
+        if _nodes_data is None:
+            return
+
+        _by_id = {_n.node_id: _n for _n in self.nodes}
+        if len(_by_id) != len(_nodes_data) or any(
+            _node["node_id"] not in _by_id for _node in _nodes_data
+        ):
+            self._load_nodes(_nodes_data, _etag)
+            return
+
+        for _node in _nodes_data:
+            _by_id[_node["node_id"]].status = _node["status"]
+        self._remember_etag("nodes", _etag)
+
+    def _wait_for_nodes_status(self, status, timeout, initial=0.1, max_interval=1.0):
+        """
+        Queries the nodes of the project until all of them report `status`, except the
+        built-in nodes which cannot be started or stopped. The wait between queries
+        starts at `initial` seconds and doubles up to `max_interval`, giving up after
+        `timeout` seconds.
+        """
+        _deadline = time.monotonic() + timeout
+        _delay = initial
+        while True:
+            self._refresh_node_statuses()
+            _remaining = _deadline - time.monotonic()
+            if _remaining <= 0 or all(
+                _n.status == status
+                for _n in self.nodes
+                if _n.node_type not in _BUILTIN_NODE_TYPES
+            ):
+                return
+            time.sleep(min(_delay, _remaining))
+            _delay = min(_delay * 2, max_interval)
+
+    @verify_connector_and_id
+    def _get_nodes_and_links(self, get_nodes=True, get_links=True):
+        """
+        Retrieves the nodes and/or links of the project. When both are requested the
+        queries run concurrently, and their results are loaded afterwards (nodes first)
+        """
+        if not (get_nodes and get_links):
+            if get_nodes:
+                self.get_nodes()
+            if get_links:
+                self.get_links()
+            return
+
+        with ThreadPoolExecutor(max_workers=2) as _executor:
+            _nodes = _executor.submit(self._fetch, "nodes")
+            _links = _executor.submit(self._fetch, "links")
+            _nodes_data, _nodes_etag = _nodes.result()
+            _links_data, _links_etag = _links.result()
+
+        if _nodes_data is not None:
+            self._load_nodes(_nodes_data, _nodes_etag)
+        if _links_data is not None:
+            self._load_links(_links_data, _links_etag)
+        else:
+            self._assign_node_links()
+
+    def _ensure_loaded(self, *kinds):
+        "Retrieves the `nodes` and/or `links` of the project if they are not loaded"
+        _missing = [_k for _k in kinds if not getattr(self, _k)]
+        if _missing:
+            self._get_nodes_and_links(
+                get_nodes="nodes" in _missing, get_links="links" in _missing
+            )
 
     @verify_connector_and_id
     def start_nodes(self, poll_wait_time=5):
         """
         Starts all the nodes inside the project.
 
-        - `poll_wait_time` is used as a delay when performing the next query of the
-        nodes status.
+        - `poll_wait_time` is the maximum time to wait for all the nodes to report
+        themselves as started. It returns as soon as they do.
 
         **Required Attributes:**
 
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/nodes/start"
+        _url = f"{self._url}/nodes/start"
 
         self.connector.http_call("post", _url)
 
         # Update object
-        time.sleep(poll_wait_time)
-        self.get_nodes()
+        self._wait_for_nodes_status("started", poll_wait_time)
 
     @verify_connector_and_id
     def stop_nodes(self, poll_wait_time=5):
         """
         Stops all the nodes inside the project.
 
-        - `poll_wait_time` is used as a delay when performing the next query of the
-        nodes status.
+        - `poll_wait_time` is the maximum time to wait for all the nodes to report
+        themselves as stopped. It returns as soon as they do.
 
         **Required Attributes:**
 
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/nodes/stop"
+        _url = f"{self._url}/nodes/stop"
 
         self.connector.http_call("post", _url)
 
         # Update object
-        time.sleep(poll_wait_time)
-        self.get_nodes()
+        self._wait_for_nodes_status("stopped", poll_wait_time)
 
     @verify_connector_and_id
     def reload_nodes(self, poll_wait_time=5):
         """
         Reloads all the nodes inside the project.
 
-        - `poll_wait_time` is used as a delay when performing the next query of the
-        nodes status.
+        - `poll_wait_time` is the maximum time to wait for all the nodes to report
+        themselves as started. It returns as soon as they do.
 
         **Required Attributes:**
 
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/nodes/reload"
+        _url = f"{self._url}/nodes/reload"
 
         self.connector.http_call("post", _url)
 
         # Update object
-        time.sleep(poll_wait_time)
-        self.get_nodes()
+        self._wait_for_nodes_status("started", poll_wait_time)
 
     @verify_connector_and_id
     def suspend_nodes(self, poll_wait_time=5):
         """
         Suspends all the nodes inside the project.
 
-        - `poll_wait_time` is used as a delay when performing the next query of the
-        nodes status.
+        - `poll_wait_time` is the maximum time to wait for all the nodes to report
+        themselves as suspended. It returns as soon as they do.
 
         **Required Attributes:**
 
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/nodes/suspend"
+        _url = f"{self._url}/nodes/suspend"
 
         self.connector.http_call("post", _url)
 
         # Update object
-        time.sleep(poll_wait_time)
-        self.get_nodes()
+        self._wait_for_nodes_status("suspended", poll_wait_time)
 
     def nodes_summary(self, is_print=True):
         """
@@ -1555,19 +2046,17 @@ class Project:
         - `project_id`
         - `connector`
         """
-        if not self.nodes:
-            self.get_nodes()
+        self._ensure_loaded("nodes")
 
-        _nodes_summary = []
-        for _n in self.nodes:
-            if is_print:
-                print(
-                    f"{_n.name}: {_n.status} -- Console: {_n.console} -- "
-                    f"ID: {_n.node_id}"
-                )
-            _nodes_summary.append((_n.name, _n.status, _n.console, _n.node_id))
+        _nodes_summary = [
+            (_n.name, _n.status, _n.console, _n.node_id) for _n in self.nodes
+        ]
 
-        return _nodes_summary if not is_print else None
+        if is_print:
+            if _nodes_summary:
+                print("\n".join(_NODE_SUMMARY_LINE(*_n) for _n in _nodes_summary))
+            return None
+        return _nodes_summary
 
     def nodes_inventory(self):
         """
@@ -1590,8 +2079,7 @@ class Project:
         - `connector`
         """
 
-        if not self.nodes:
-            self.get_nodes()
+        self._ensure_loaded("nodes")
 
         _nodes_inventory = {}
         _server = urlparse(self.connector.base_url).hostname
@@ -1625,10 +2113,23 @@ class Project:
         - `project_id`
         - `connector`
         """
-        if not self.nodes:
-            self.get_nodes()
-        if not self.links:
-            self.get_links()
+        self._ensure_loaded("nodes", "links")
+
+        _links_summary = self._build_links_summary()
+        if is_print:
+            if _links_summary:
+                print("\n".join(_LINK_SUMMARY_LINE(*_l) for _l in _links_summary))
+            return None
+        return _links_summary
+
+    def _build_links_summary(self):
+        "Builds the `(node_a, port_a, node_b, port_b)` tuples of the project links"
+        _nodes_by_id = {_n.node_id: _n for _n in self.nodes}
+        _port_names = {
+            (_n.node_id, _p["adapter_number"], _p["port_number"]): _p["name"]
+            for _n in self.nodes
+            for _p in _n.ports or []
+        }
 
         _links_summary = []
         for _l in self.links:
@@ -1636,38 +2137,84 @@ class Project:
                 continue
             _side_a = _l.nodes[0]
             _side_b = _l.nodes[1]
-            _node_a = [x for x in self.nodes if x.node_id == _side_a["node_id"]][0]
-            _port_a = [
-                x["name"]
-                for x in _node_a.ports
-                if x["port_number"] == _side_a["port_number"]
-                and x["adapter_number"] == _side_a["adapter_number"]
-            ][0]
-            _node_b = [x for x in self.nodes if x.node_id == _side_b["node_id"]][0]
-            _port_b = [
-                x["name"]
-                for x in _node_b.ports
-                if x["port_number"] == _side_b["port_number"]
-                and x["adapter_number"] == _side_b["adapter_number"]
-            ][0]
-            endpoint_a = f"{_node_a.name}: {_port_a}"
-            endpoint_b = f"{_node_b.name}: {_port_b}"
-            if is_print:
-                print(f"{endpoint_a} ---- {endpoint_b}")
+            _node_a = _nodes_by_id[_side_a["node_id"]]
+            _port_a = _port_names[
+                (_side_a["node_id"], _side_a["adapter_number"], _side_a["port_number"])
+            ]
+            _node_b = _nodes_by_id[_side_b["node_id"]]
+            _port_b = _port_names[
+                (_side_b["node_id"], _side_b["adapter_number"], _side_b["port_number"])
+            ]
             _links_summary.append((_node_a.name, _port_a, _node_b.name, _port_b))
 
-        return _links_summary if not is_print else None
+        return _links_summary
+
+    def _topology_changed(self):
+        "Marks the nodes or links as changed, so the lookup indexes are rebuilt"
+        # Rebuilt on their next use, instead of detecting the change on a lookup
+        self.__dict__.pop("_indexes", None)
+
+    def _search_index(self, items, key, value, getter=None):
+        """
+        Looks up `value` in a `{key: item}` index of `items` (the `nodes`, `links` or
+        `drawings` list), reading `key` with `getter` or as an attribute. The index is
+        rebuilt when the list is replaced or changes its size, and also on a miss or
+        stale hit, since the list and items can be edited in place.
+        """
+        _indexes = self.__dict__.setdefault("_indexes", {})
+        _index = _indexes.get(key)
+        _getter = getter or attrgetter(key)
+        if _index is not None and _index[0] is items and _index[1] == len(items):
+            _item = _index[2].get(value)
+            if (
+                _item is not None
+                and _getter(_item) == value
+                and _is_listed(_item, items)
+            ):
+                return _item
+
+        # Index missing, outdated or without the value, so rebuild it
+        _by_key = {_getter(_i): _i for _i in reversed(items)}
+        _indexes[key] = (items, len(items), _by_key)
+        return _by_key.get(value)
+
+    def _link_by_endpoint(self, node, port):
+        """
+        Looks up the link attached to the `port` of `node` in a
+        `{(node_id, adapter_number, port_number): link}` index of the project links.
+        The index is rebuilt when the `links` list is replaced or changes its size, and
+        also on a miss or stale hit, since the list and links can be edited in place.
+        """
+        _key = (node.node_id, port["adapter_number"], port["port_number"])
+        _indexes = self.__dict__.setdefault("_indexes", {})
+        _index = _indexes.get("endpoint")
+        if (
+            _index is not None
+            and _index[0] is self.links
+            and _index[1] == len(self.links)
+        ):
+            _link = _index[2].get(_key)
+            if (
+                _link is not None
+                and _key in _endpoint_keys(_link)
+                and _is_listed(_link, self.links)
+            ):
+                return _link
+
+        # Index missing, outdated or without the endpoint, so rebuild it
+        _by_endpoint = {}
+        for _l in reversed(self.links):
+            for _endpoint in _endpoint_keys(_l):
+                _by_endpoint[_endpoint] = _l
+        _indexes["endpoint"] = (self.links, len(self.links), _by_endpoint)
+        return _by_endpoint.get(_key)
 
     def _search_node(self, key, value):
         "Performs a search based on a key and value"
         # Retrive nodes if neccesary
-        if not self.nodes:
-            self.get_nodes()
+        self._ensure_loaded("nodes")
 
-        try:
-            return [_p for _p in self.nodes if getattr(_p, key) == value][0]
-        except IndexError:
-            return None
+        return self._search_index(self.nodes, key, value)
 
     def get_node(self, name=None, node_id=None):
         """
@@ -1689,18 +2236,14 @@ class Project:
         elif name:
             return self._search_node(key="name", value=name)
         else:
-            raise ValueError("name or node_ide must be provided")
+            raise ValueError("name or node_id must be provided")
 
     def _search_link(self, key, value):
         "Performs a search based on a key and value"
         # Retrive links if neccesary
-        if not self.links:
-            self.get_links()
+        self._ensure_loaded("links")
 
-        try:
-            return next(_p for _p in self.links if getattr(_p, key) == value)
-        except StopIteration:
-            return None
+        return self._search_index(self.links, key, value)
 
     def get_link(self, link_id):
         """
@@ -1735,18 +2278,67 @@ class Project:
 
         - `template` or `template_id`
         """
-        if not self.nodes:
-            self.get_nodes()
+        self._ensure_loaded("nodes")
 
         _node = Node(project_id=self.project_id, connector=self.connector, **kwargs)
 
         _node.create()
         self.nodes.append(_node)
+        self._topology_changed()
         print(
             f"Created: {_node.name} -- Type: {_node.node_type} -- "
             f"Console: {_node.console}"
         )
 
+    def create_nodes(self, nodes_kwargs, max_workers=8):
+        """
+        Creates several nodes, sending up to `max_workers` creation requests at the same
+        time. Each item of `nodes_kwargs` holds the keyword arguments of `create_node`:
+
+        ```python
+        project.create_nodes([
+            dict(name='test-switch01', template='Ethernet switch'),
+            dict(name='test-switch02', template='Ethernet switch'),
+        ])
+        ```
+
+        The nodes created are added in the given order. If any creation fails, the
+        first error is raised after the rest of the nodes were processed.
+
+        **Required Project instance attributes:**
+
+        - `project_id`
+        - `connector`
+        """
+        self._ensure_loaded("nodes")
+
+        _nodes = [
+            Node(project_id=self.project_id, connector=self.connector, **_kwargs)
+            for _kwargs in nodes_kwargs
+        ]
+        # Warm the templates cache once, instead of every worker querying the server
+        if any(_node.template and not _node.template_id for _node in _nodes):
+            self.connector.get_templates()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as _executor:
+            _futures = [_executor.submit(_node.create) for _node in _nodes]
+
+        _errors = []
+        for _node, _future in zip(_nodes, _futures):
+            _error = _future.exception()
+            if _error is not None:
+                _errors.append(_error)
+                continue
+            self.nodes.append(_node)
+            print(
+                f"Created: {_node.name} -- Type: {_node.node_type} -- "
+                f"Console: {_node.console}"
+            )
+        self._topology_changed()
+
+        if _errors:
+            raise _errors[0]
+
     def create_link(self, node_a, port_a, node_b, port_b):
         """
         Creates a link.
@@ -1762,45 +2354,27 @@ class Project:
         - `port_b`: Port name of the B side (must match the `name` attribute of the
         port)
         """
-        if not self.nodes:
-            self.get_nodes()
-        if not self.links:
-            self.get_links()
+        self._ensure_loaded("nodes", "links")
 
         _node_a = self.get_node(name=node_a)
         if not _node_a:
             raise ValueError(f"node_a: {node_a} not found")
-        try:
-            _port_a = [_p for _p in _node_a.ports if _p["name"] == port_a][0]
-        except IndexError:
+        _port_a = _node_a._port_by_name(port_a)
+        if _port_a is None:
             raise ValueError(f"port_a: {port_a} not found")
 
         _node_b = self.get_node(name=node_b)
         if not _node_b:
             raise ValueError(f"node_b: {node_b} not found")
-        try:
-            _port_b = [_p for _p in _node_b.ports if _p["name"] == port_b][0]
-        except IndexError:
+        _port_b = _node_b._port_by_name(port_b)
+        if _port_b is None:
             raise ValueError(f"port_b: {port_b} not found")
 
-        _matches = []
-        for _l in self.links:
-            if not _l.nodes:
-                continue
-            if (
-                _l.nodes[0]["node_id"] == _node_a.node_id
-                and _l.nodes[0]["adapter_number"] == _port_a["adapter_number"]
-                and _l.nodes[0]["port_number"] == _port_a["port_number"]
-            ):
-                _matches.append(_l)
-            elif (
-                _l.nodes[1]["node_id"] == _node_b.node_id
-                and _l.nodes[1]["adapter_number"] == _port_b["adapter_number"]
-                and _l.nodes[1]["port_number"] == _port_b["port_number"]
-            ):
-                _matches.append(_l)  # pragma: no cover
-        if _matches:
-            raise ValueError(f"At least one port is used, ID: {_matches[0].link_id}")
+        _match = self._link_by_endpoint(_node_a, _port_a) or self._link_by_endpoint(
+            _node_b, _port_b
+        )
+        if _match:
+            raise ValueError(f"At least one port is used, ID: {_match.link_id}")
 
         # Now create the link!
         _link = Link(
@@ -1824,6 +2398,7 @@ class Project:
 
         _link.create()
         self.links.append(_link)
+        self._topology_changed()
         print(f"Created Link-ID: {_link.link_id} -- Type: {_link.link_type}")
 
     def delete_link(self, node_a, port_a, node_b, port_b):
@@ -1841,52 +2416,35 @@ class Project:
         - `port_b`: Port name of the B side (must match the `name` attribute of the
         port)
         """
-        if not self.nodes:
-            self.get_nodes()  # pragma: no cover
-        if not self.links:
-            self.get_links()  # pragma: no cover
+        self._ensure_loaded("nodes", "links")
 
         # checking link info
         _node_a = self.get_node(name=node_a)
         if not _node_a:
             raise ValueError(f"node_a: {node_a} not found")
-        try:
-            _port_a = [_p for _p in _node_a.ports if _p["name"] == port_a][0]
-        except IndexError:
+        _port_a = _node_a._port_by_name(port_a)
+        if _port_a is None:
             raise ValueError(f"port_a: {port_a} not found")
 
         _node_b = self.get_node(name=node_b)
         if not _node_b:
             raise ValueError(f"node_b: {node_b} not found")
-        try:
-            _port_b = [_p for _p in _node_b.ports if _p["name"] == port_b][0]
-        except IndexError:
+        _port_b = _node_b._port_by_name(port_b)
+        if _port_b is None:
             raise ValueError(f"port_b: {port_b} not found")
 
-        _matches = []
-        for _l in self.links:
-            if not _l.nodes:
-                continue
-            if (
-                _l.nodes[0]["node_id"] == _node_a.node_id
-                and _l.nodes[0]["adapter_number"] == _port_a["adapter_number"]
-                and _l.nodes[0]["port_number"] == _port_a["port_number"]
-            ):
-                _matches.append(_l)
-            elif (
-                _l.nodes[1]["node_id"] == _node_b.node_id
-                and _l.nodes[1]["adapter_number"] == _port_b["adapter_number"]
-                and _l.nodes[1]["port_number"] == _port_b["port_number"]
-            ):
-                _matches.append(_l)
-        if not _matches:
+        _match = self._link_by_endpoint(_node_a, _port_a) or self._link_by_endpoint(
+            _node_b, _port_b
+        )
+        if not _match:
             raise ValueError(
                 f"Link not found: {node_a, port_a, node_b, port_b}"
             )  # pragma: no cover
 
-            # now to delete the link via GNS3_api
-        _link = _matches[0]
+        # now to delete the link via GNS3_api
+        _link = _match
         self.links.remove(_link)
+        self._topology_changed()
         _link_id = _link.link_id
         _link.delete()
         print(
@@ -1904,20 +2462,16 @@ class Project:
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/snapshots"
+        _url = f"{self._url}/snapshots"
 
-        response = self.connector.http_call("get", _url)
-        self.snapshots = response.json()
+        self.snapshots = self.connector.http_call_json("get", _url)
 
     def _search_snapshot(self, key, value):
         "Performs a search based on a key and value"
         if not self.snapshots:
             self.get_snapshots()
 
-        try:
-            return next(_p for _p in self.snapshots if _p[key] == value)
-        except StopIteration:
-            return None
+        return next((_p for _p in self.snapshots if _p[key] == value), None)
 
     def get_snapshot(self, name=None, snapshot_id=None):
         """
@@ -1958,11 +2512,11 @@ class Project:
         if _snapshot:
             raise ValueError("Snapshot already created")
 
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/snapshots"
-
-        response = self.connector.http_call("post", _url, json_data=dict(name=name))
+        _url = f"{self._url}/snapshots"
 
-        _snapshot = response.json()
+        _snapshot = self.connector.http_call_json(
+            "post", _url, json_data=dict(name=name)
+        )
 
         self.snapshots.append(_snapshot)
         print(f"Created snapshot: {_snapshot['name']}")
@@ -1987,10 +2541,7 @@ class Project:
         if not _snapshot:
             raise ValueError("Snapshot not found")
 
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/snapshots/"
-            f"{_snapshot['snapshot_id']}"
-        )
+        _url = f"{self._url}/snapshots/{_snapshot['snapshot_id']}"
 
         self.connector.http_call("delete", _url)
 
@@ -2016,10 +2567,7 @@ class Project:
         if not _snapshot:
             raise ValueError("Snapshot not found")
 
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/snapshots/"
-            f"{_snapshot['snapshot_id']}/restore"
-        )
+        _url = f"{self._url}/snapshots/{_snapshot['snapshot_id']}/restore"
 
         self.connector.http_call("post", _url)
 
@@ -2069,14 +2617,15 @@ class Project:
         if not self.drawings:
             self.get_drawings()
 
-        try:
-            return next(
-                _drawing
-                for _drawing in self.drawings
-                if _drawing["drawing_id"] == drawing_id
-            )
-        except StopIteration:
+        return self._drawing_by_id(drawing_id)
+
+    def _drawing_by_id(self, drawing_id):
+        "Looks up a drawing by its ID among the drawings already retrieved"
+        if not self.drawings:
             return None
+        return self._search_index(
+            self.drawings, "drawing_id", drawing_id, getter=itemgetter("drawing_id")
+        )
 
     @verify_connector_and_id
     def get_drawings(self):
@@ -2088,10 +2637,10 @@ class Project:
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/drawings"
-
-        _response = self.connector.http_call("get", _url)
-        self.drawings = _response.json()
+        _drawings, _etag = self._fetch("drawings")
+        if _drawings is not None:
+            self.drawings = _drawings
+            self._remember_etag("drawings", _etag)
 
     @verify_connector_and_id
     def create_drawing(self, svg, locked=False, x=10, y=10, z=1):
@@ -2103,17 +2652,68 @@ class Project:
         - `project_id`
         - `connector`
         """
-        _url = f"{self.connector.base_url}/projects/{self.project_id}/drawings"
-
-        response = self.connector.http_call(
-            "post", _url, json_data=dict(svg=svg, locked=locked, x=x, y=y, z=z)
-        )
+        # Load the drawings first, so the new one has a list to be added to
+        if self.drawings is None:
+            self.get_drawings()
 
-        _drawing = response.json()
+        _drawing = self._post_drawing(svg=svg, locked=locked, x=x, y=y, z=z)
 
         self.drawings.append(_drawing)
         print(f"Created drawing: {_drawing['drawing_id']}")
 
+    def _post_drawing(self, svg, locked=False, x=10, y=10, z=1):
+        "Creates a drawing on the server and returns it"
+        return self.connector.http_call_json(
+            "post",
+            f"{self._url}/drawings",
+            json_data=dict(svg=svg, locked=locked, x=x, y=y, z=z),
+        )
+
+    @verify_connector_and_id
+    def create_drawings(self, drawings_kwargs, max_workers=8):
+        """
+        Creates several drawings, sending up to `max_workers` creation requests at the
+        same time. Each item of `drawings_kwargs` holds the keyword arguments of
+        `create_drawing`:
+
+        ```python
+        project.create_drawings([
+            dict(svg=generate_rectangle_svg(), x=0, y=0),
+            dict(svg=generate_ellipse_svg(), x=300, y=0),
+        ])
+        ```
+
+        The drawings created are added in the given order. If any creation fails, the
+        first error is raised after the rest of the drawings were processed.
+
+        **Required Project instance attributes:**
+
+        - `project_id`
+        - `connector`
+        """
+        # Load the drawings first, so the new ones have a list to be added to
+        if self.drawings is None:
+            self.get_drawings()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as _executor:
+            _futures = [
+                _executor.submit(self._post_drawing, **_kwargs)
+                for _kwargs in drawings_kwargs
+            ]
+
+        _errors = []
+        for _future in _futures:
+            _error = _future.exception()
+            if _error is not None:
+                _errors.append(_error)
+                continue
+            _drawing = _future.result()
+            self.drawings.append(_drawing)
+            print(f"Created drawing: {_drawing['drawing_id']}")
+
+        if _errors:
+            raise _errors[0]
+
     @verify_connector_and_id
     def update_drawing(self, drawing_id, svg=None, locked=None, x=None, y=None, z=None):
         """
@@ -2124,47 +2724,30 @@ class Project:
         - `project_id`
         - `connector`
         """
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/drawings/"
-            f"{drawing_id}"
-        )
+        _url = f"{self._url}/drawings/{drawing_id}"
+
+        # Locate the drawing once to fill the attributes not passed
+        _drawing = self._drawing_by_id(drawing_id)
+        if None in (svg, locked, x, y, z):
+            if not _drawing:
+                raise ValueError("drawing not found")
+            svg = _drawing["svg"] if svg is None else svg
+            locked = _drawing["locked"] if locked is None else locked
+            x = _drawing["x"] if x is None else x
+            y = _drawing["y"] if y is None else y
+            z = _drawing["z"] if z is None else z
 
-        if svg is None:
-            svg = [
-                draw["svg"]
-                for draw in self.drawings
-                if draw["drawing_id"] == drawing_id
-            ][0]
-
-        if locked is None:
-            locked = [
-                draw["locked"]
-                for draw in self.drawings
-                if draw["drawing_id"] == drawing_id
-            ][0]
-
-        if x is None:
-            x = [
-                draw["x"] for draw in self.drawings if draw["drawing_id"] == drawing_id
-            ][0]
-
-        if y is None:
-            y = [
-                draw["y"] for draw in self.drawings if draw["drawing_id"] == drawing_id
-            ][0]
-
-        if z is None:
-            z = [
-                draw["z"] for draw in self.drawings if draw["drawing_id"] == drawing_id
-            ][0]
-
-        response = self.connector.http_call(
+        response = self.connector.http_call_json(
             "put", _url, json_data=dict(svg=svg, locked=locked, x=x, y=y, z=z)
         )
 
-        self.get_drawings()
+        # Apply the update locally instead of retrieving all the drawings again
+        if _drawing:
+            _drawing.update(response)
+        else:
+            self.get_drawings()
 
-        return response.json()
+        return response
 
     @verify_connector_and_id
     def delete_drawing(self, drawing_id=None):
@@ -2186,11 +2769,54 @@ class Project:
         if not _drawing:
             raise ValueError("drawing not found")
 
-        _url = (
-            f"{self.connector.base_url}/projects/{self.project_id}/drawings/"
-            f"{_drawing['drawing_id']}"
-        )
+        _url = f"{self._url}/drawings/{_drawing['drawing_id']}"
 
         self.connector.http_call("delete", _url)
 
+        # The drawings were just retrieved, so only the deleted one has to go
+        self._forget_drawings([_drawing])
+
+    @verify_connector_and_id
+    def delete_drawings(self, drawing_ids, max_workers=8):
+        """
+        Deletes several drawings of the project, sending up to `max_workers` deletion
+        requests at the same time. Nothing is deleted if any of the `drawing_ids` is
+        not found. If any deletion fails, the first error is raised after the rest of
+        the drawings were processed.
+
+        **Required Project instance attributes:**
+
+        - `project_id`
+        - `connector`
+        """
         self.get_drawings()
+
+        # Each drawing is deleted once, even if its ID is repeated
+        _drawings = [self._drawing_by_id(_id) for _id in dict.fromkeys(drawing_ids)]
+        if not all(_drawings):
+            raise ValueError("drawing not found")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as _executor:
+            _futures = [
+                _executor.submit(
+                    self.connector.http_call,
+                    "delete",
+                    f"{self._url}/drawings/{_drawing['drawing_id']}",
+                )
+                for _drawing in _drawings
+            ]
+
+        _errors = [_f.exception() for _f in _futures if _f.exception() is not None]
+        self._forget_drawings(
+            [_d for _d, _f in zip(_drawings, _futures) if _f.exception() is None]
+        )
+
+        if _errors:
+            raise _errors[0]
+
+    def _forget_drawings(self, drawings):
+        "Removes drawings deleted on the server from the `drawings` attribute"
+        for _drawing in drawings:
+            self.drawings.remove(_drawing)
+        # Otherwise a later lookup of a deleted ID could still hit the index
+        self.__dict__.get("_indexes", {}).pop("drawing_id", None)
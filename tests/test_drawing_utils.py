@@ -4,6 +4,7 @@ from gns3fy.drawing_utils import (
     generate_rectangle_svg,
     parsed_x,
     parsed_y,
+    parsed_xy,
 )
 
 
@@ -15,6 +16,13 @@ def test_generate_rectangle_svg():
     )
 
 
+def test_generate_rectangle_svg_cached_by_type():
+    assert generate_rectangle_svg(fill_opacity=1.0) is generate_rectangle_svg(
+        fill_opacity=1.0
+    )
+    assert 'fill-opacity="1"' in generate_rectangle_svg(fill_opacity=1)
+
+
 def test_generate_ellipse_svg():
     rectangle = generate_ellipse_svg()
     assert rectangle == (
@@ -40,3 +48,9 @@ def test_parsed_x():
 def test_parsed_y():
     y_value = parsed_y(y=7)
     assert y_value == -700
+
+
+def test_parsed_xy():
+    xs, ys = parsed_xy(xs=[0, 7], ys=[0, 7])
+    assert xs == [0, parsed_x(x=7)]
+    assert ys == [0, parsed_y(y=7)]
@@ -1,5 +1,9 @@
+import copy
 import json
+import pickle
 import pytest
+import time
+import threading
 import requests
 import requests_mock
 from pathlib import Path
@@ -111,6 +115,11 @@ def json_api_test_link():
     return next((_l for _l in links_data() if _l["link_id"] == CLINK["id"]))
 
 
+def json_body(data):
+    "Encodes the data as the JSON body of a mocked response"
+    return json.dumps(data).encode()
+
+
 def post_put_matcher(request):
     "Creates the Responses for POST and PUT requests"
     resp = requests.Response()
@@ -123,12 +132,12 @@ def post_put_matcher(request):
             _data = request.json()
             if _data["name"] == "API_TEST":
                 resp.status_code = 200
-                resp.json = json_api_test_project
+                resp._content = json_body(json_api_test_project())
                 return resp
             elif _data["name"] == "DUPLICATE":
                 resp.status_code = 409
-                resp.json = lambda: dict(
-                    message="Project 'DUPLICATE' already exists", status=409
+                resp._content = json_body(
+                    dict(message="Project 'DUPLICATE' already exists", status=409)
                 )
                 return resp
         elif request.path_url.endswith(f"/{CPROJECT['id']}/close"):
@@ -138,14 +147,14 @@ def post_put_matcher(request):
             _returned = json_api_test_project()
             _returned.update(status="opened")
             resp.status_code = 204
-            resp.json = lambda: _returned
+            resp._content = json_body(_returned)
             return resp
         elif request.path_url.endswith(
             f"/{CPROJECT['id']}/templates/{CTEMPLATE['id']}"
         ):
             _returned = json_api_test_node()
             resp.status_code = 201
-            resp.json = lambda: _returned
+            resp._content = json_body(_returned)
             return resp
         elif request.path_url.endswith(f"/{CPROJECT['id']}/files/README.txt"):
             resp.status_code = 200
@@ -160,7 +169,7 @@ def post_put_matcher(request):
                     project_id="28ea5feb-c006-4724-80ec-a7cc0d8b8a5a",
                     snapshot_id="6796e3ad-ce6d-47db-bdd7-b305506ea22d",
                 )
-                resp.json = lambda: _returned
+                resp._content = json_body(_returned)
                 resp.status_code = 201
                 return resp
         elif request.path_url.endswith(f"/{CPROJECT['id']}/drawings"):
@@ -175,21 +184,21 @@ def post_put_matcher(request):
                 project_id="28ea5feb-c006-4724-80ec-a7cc0d8b8a5a",
                 drawing_id="62afa856-4a43-4444-a376-60f6f963bb3d",
             )
-            resp.json = lambda: _returned
+            resp._content = json_body(_returned)
             resp.status_code = 201
             return resp
         elif request.path_url.endswith(
             f"/{CPROJECT['id']}/snapshots/44e08d78-0ee4-4b8f-bad4-117aa67cb759/restore"
         ):
             _returned = json_api_test_project()
-            resp.json = lambda: _returned
+            resp._content = json_body(_returned)
             resp.status_code = 201
             return resp
         elif request.path_url.endswith(f"/{CPROJECT['id']}/nodes"):
             _data = request.json()
             if not any(x in _data for x in ("compute_id", "name", "node_type")):
                 resp.status_code == 400
-                resp.json = lambda: dict(message="Invalid request", status=400)
+                resp._content = json_body(dict(message="Invalid request", status=400))
                 return resp
             resp.status_code = 201
             _returned = json_api_test_node()
@@ -207,7 +216,7 @@ def post_put_matcher(request):
             # For the case when properties have been overriden
             if _data["properties"].get("console_http_port") == 8080:
                 _returned.update(properties=_data["properties"])
-            resp.json = lambda: _returned
+            resp._content = json_body(_returned)
             return resp
         elif request.path_url.endswith(
             f"/{CPROJECT['id']}/nodes/start"
@@ -226,13 +235,13 @@ def post_put_matcher(request):
             _returned = json_api_test_node()
             _returned.update(status="started")
             resp.status_code = 200
-            resp.json = lambda: _returned
+            resp._content = json_body(_returned)
             return resp
         elif request.path_url.endswith(f"/{CPROJECT['id']}/nodes/{CNODE['id']}/stop"):
             _returned = json_api_test_node()
             _returned.update(status="stopped")
             resp.status_code = 200
-            resp.json = lambda: _returned
+            resp._content = json_body(_returned)
             return resp
         elif request.path_url.endswith(
             f"/{CPROJECT['id']}/nodes/{CNODE['id']}/files//etc/network/interfaces"
@@ -245,7 +254,7 @@ def post_put_matcher(request):
             _returned = json_api_test_node()
             _returned.update(status="suspended")
             resp.status_code = 200
-            resp.json = lambda: _returned
+            resp._content = json_body(_returned)
             return resp
         elif request.path_url.endswith(f"/{CPROJECT['id']}/links"):
             _data = request.json()
@@ -253,34 +262,36 @@ def post_put_matcher(request):
             if len(nodes) != 2:
                 resp.status_code = 400
                 resp.url = request.path_url
-                resp.json = lambda: dict(message="Bad Request", status=400)
+                resp._content = json_body(dict(message="Bad Request", status=400))
                 return resp
             elif nodes[0]["node_id"] == nodes[1]["node_id"]:
                 resp.status_code = 409
                 resp.url = request.path_url
-                resp.json = lambda: dict(message="Cannot connect to itself", status=409)
+                resp._content = json_body(
+                    dict(message="Cannot connect to itself", status=409)
+                )
                 return resp
             _returned = json_api_test_link()
             resp.status_code = 201
             if any(x for x in nodes if x["node_id"] == CNODE["id"]):
-                resp.json = lambda: _returned
+                resp._content = json_body(_returned)
             else:
                 _returned.update(**_data)
                 _returned.update(link_id="NEW_LINK_ID")
-                resp.json = lambda: _returned
+                resp._content = json_body(_returned)
             return resp
         elif request.path_url.endswith("/templates"):
             _data = request.json()
             if _data["name"] == "alpinev2":
                 resp.status_code = 201
-                resp.json = lambda: _data
+                resp._content = json_body(_data)
                 return resp
     elif request.method == "PUT":
         if request.path_url.endswith(f"/{CPROJECT['id']}"):
             _data = request.json()
             _returned = json_api_test_project()
             resp.status_code = 200
-            resp.json = lambda: {**_returned, **_data}
+            resp._content = json_body({**_returned, **_data})
             return resp
         elif request.path_url.endswith(f"/{CPROJECT['id']}/nodes/{CNODE['id']}"):
             _data = request.json()
@@ -299,32 +310,32 @@ def post_put_matcher(request):
             if _data.get("name") != "alpine-1":
                 _returned.update(node_id="NEW_NODE_ID")
             resp.status_code = 200
-            resp.json = lambda: _returned
+            resp._content = json_body(_returned)
             return resp
         # For the arrange_nodes_circular
         elif f"/{CPROJECT['id']}/nodes" in request.path_url:
             # _data = request.json()
             _returned = json_api_test_node()
             resp.status_code = 200
-            resp.json = lambda: _returned
+            resp._content = json_body(_returned)
             return resp
         elif request.path_url.endswith(f"/templates/{CTEMPLATE['id']}"):
             _data = request.json()
             if _data["category"] == "switch":
                 resp.status_code = 200
-                resp.json = lambda: _data
+                resp._content = json_body(_data)
                 return resp
         elif request.path_url.endswith(f"/drawings/{CDRAWING['id']}"):
             _data = request.json()
             if _data["x"] == -256:
                 resp.status_code = 201
-                resp.json = lambda: _data
+                resp._content = json_body(_data)
                 return resp
         elif request.path_url.endswith(f"/{CPROJECT['id']}/links/{CLINK['id']}"):
             _data = request.json()
             _returned = json_api_test_link()
             resp.status_code = 200
-            resp.json = lambda: {**_returned, **_data}
+            resp._content = json_body({**_returned, **_data})
             return resp
     return None
 
@@ -603,6 +614,20 @@ class TestGns3Connector:
     def test_get_version(self, gns3_server):
         assert dict(local=True, version="2.2.0") == gns3_server.get_version()
 
+    def test_get_version_without_orjson(self, monkeypatch, gns3_server):
+        monkeypatch.setattr("gns3fy.gns3fy.orjson", None)
+        gns3_server.invalidate_cache()
+        assert dict(local=True, version="2.2.0") == gns3_server.get_version()
+
+    def test_get_version_cached(self):
+        server = Gns3ConnectorMock(url=BASE_URL)
+        server.get_version()["version"] = "dummy"
+        assert dict(local=True, version="2.2.0") == server.get_version()
+        assert server.api_calls == 1
+        server.invalidate_cache()
+        server.get_version()
+        assert server.api_calls == 2
+
     def test_get_templates(self, gns3_server):
         response = gns3_server.get_templates()
         for index, n in enumerate(
@@ -636,6 +661,27 @@ class TestGns3Connector:
         assert "docker" == response["template_type"]
         assert "guest" == response["category"]
 
+    def test_get_templates_cached(self):
+        server = Gns3ConnectorMock(url=BASE_URL)
+        server.get_templates()
+        server.get_template(name="alpine")
+        server.get_template(template_id=CTEMPLATE["id"])
+        assert server.api_calls == 1
+        server.cache_ttl = 0
+        server.get_template(name="alpine")
+        assert server.api_calls == 2
+
+    def test_get_templates_cached_copies(self):
+        server = Gns3ConnectorMock(url=BASE_URL)
+        server.get_template(name="alpine")["name"] = "changed"
+        server.get_template(template_id=CTEMPLATE["id"])["category"] = "changed"
+        server.get_templates()[3]["template_type"] = "changed"
+        response = server.get_template(name="alpine")
+        assert "alpine" == response["name"]
+        assert "docker" == response["template_type"]
+        assert "guest" == server.get_templates()[3]["category"]
+        assert server.api_calls == 1
+
     def test_error_get_template_no_params(self, gns3_server):
         with pytest.raises(
             ValueError, match="Must provide either a name or template_id"
@@ -772,6 +818,35 @@ class TestGns3Connector:
         assert "API_TEST" == response["name"]
         assert "opened" == response["status"]
 
+    @pytest.mark.parametrize("without_orjson", [False, True])
+    def test_create_project_json_body(self, monkeypatch, without_orjson):
+        if without_orjson:
+            monkeypatch.setattr("gns3fy.gns3fy.orjson", None)
+        server = Gns3ConnectorMock(url=BASE_URL)
+        server.create_project(name="API_TEST")
+        _request = server.adapter.last_request
+        assert "application/json" == _request.headers["Content-Type"]
+        assert dict(name="API_TEST") == _request.json()
+
+    @pytest.mark.parametrize("without_orjson", [False, True])
+    def test_http_call_json_body_keys(self, monkeypatch, without_orjson):
+        if without_orjson:
+            monkeypatch.setattr("gns3fy.gns3fy.orjson", None)
+        server = Gns3ConnectorMock(url=BASE_URL)
+        server.adapter.register_uri("POST", f"{server.base_url}/echo", json={})
+        server.http_call("post", f"{server.base_url}/echo", json_data={1: "a"})
+        assert {"1": "a"} == server.adapter.last_request.json()
+        server.http_call("post", f"{server.base_url}/echo", json_data={"b": 1 << 70})
+        assert {"b": 1 << 70} == server.adapter.last_request.json()
+
+    def test_error_without_json_body(self):
+        server = Gns3ConnectorMock(url=BASE_URL)
+        server.adapter.register_uri(
+            "GET", f"{server.base_url}/version", status_code=502, text="Bad Gateway"
+        )
+        with pytest.raises(HTTPError, match="502: Bad Gateway"):
+            server.get_version()
+
     def test_error_create_duplicate_project(self, gns3_server):
         with pytest.raises(HTTPError, match="409: Project 'DUPLICATE' already exists"):
             gns3_server.create_project(name="DUPLICATE")
@@ -891,6 +966,60 @@ class TestGns3Connector:
         assert response["console_port_range"] == [5000, 10000]
         assert response["udp_port_range"] == [10000, 20000]
 
+    def test_min_interval(self, monkeypatch):
+        _sleeps = []
+        monkeypatch.setattr("gns3fy.gns3fy.time.sleep", _sleeps.append)
+        server = Gns3ConnectorMock(url=BASE_URL, min_interval=60, cache_ttl=0)
+        server.get_version()
+        server.get_version()
+        assert len(_sleeps) == 1
+        assert 0 < _sleeps[0] <= 60
+
+    def test_min_interval_threads(self, monkeypatch):
+        _sleeps = []
+        monkeypatch.setattr("gns3fy.gns3fy.time.sleep", _sleeps.append)
+        server = Gns3ConnectorMock(url=BASE_URL, min_interval=60, cache_ttl=0)
+
+        def _calls():
+            for _ in range(20):
+                server.http_call("get", f"{server.base_url}/version")
+
+        _threads = [threading.Thread(target=_calls) for _ in range(2)]
+        for _t in _threads:
+            _t.start()
+        for _t in _threads:
+            _t.join()
+        assert server.api_calls == 40
+        # Each call waits for its own slot, even when both threads race for one
+        assert sorted(round(_s / 60) for _s in _sleeps) == list(range(1, 40))
+
+    def test_shared(self, monkeypatch):
+        monkeypatch.setattr(Gns3Connector, "_shared", {})
+        server = Gns3ConnectorMock.shared(url=BASE_URL, user="shared", cred="pass")
+        assert server is Gns3ConnectorMock.shared(
+            url=BASE_URL, user="shared", cred="pass"
+        )
+        assert server is not Gns3ConnectorMock.shared(url=BASE_URL, user="other")
+        assert server is not Gns3ConnectorMock.shared(
+            url=BASE_URL, user="shared", cred="other"
+        )
+        assert server is not Gns3ConnectorMock.shared(
+            url=BASE_URL, user="shared", cred="pass", verify=True
+        )
+        assert server is not Gns3ConnectorMock.shared(
+            url=BASE_URL, user="shared", cred="pass", cache_ttl=0
+        )
+        assert 5 == len(Gns3Connector._shared)
+
+    def test_project_url_cached(self):
+        server = Gns3ConnectorMock(url=BASE_URL)
+        _url = server._project_url(CPROJECT["id"])
+        assert _url is server._project_url(CPROJECT["id"])
+        server.base_url = "mock://other/v2"
+        assert "mock://other/v2/projects/" + CPROJECT["id"] == server._project_url(
+            CPROJECT["id"]
+        )
+
     def test_wrong_server_url(self, gns3_server):
         gns3_server.base_url = "WRONG URL"
         with pytest.raises(requests.exceptions.MissingSchema, match="Invalid URL"):
@@ -1024,6 +1153,24 @@ class TestNode:
         with pytest.raises(ValueError, match=expected):
             Node(**param)
 
+    def test_from_server(self):
+        for index, node_data in enumerate(nodes_data()):
+            assert nodes.NODES_REPR[index] == repr(Node._from_server(None, node_data))
+        node = Node._from_server(None, {"name": "alpine-1", "status": "started"})
+        with pytest.raises(ValueError, match="Not a valid status - dummy"):
+            node.status = "dummy"
+        with pytest.raises(ValueError, match="Not a valid node_type - dummy"):
+            Node._from_server(None, {"node_type": "dummy"})
+
+    def test_update_from_server(self):
+        node = Node._from_server(None, {"name": "alpine-1", "status": "stopped"})
+        node._update({"status": "started", "console": 5005, "dummy": "ignored"})
+        assert "started" == node.status
+        assert 5005 == node.console
+        assert not hasattr(node, "dummy")
+        with pytest.raises(ValueError, match="Not a valid node_type - dummy"):
+            node._update({"node_type": "dummy"})
+
     @pytest.mark.parametrize(
         "params,expected",
         [
@@ -1053,6 +1200,12 @@ class TestNode:
         assert "docker" == api_test_node.node_type
         assert "alpine:latest" == api_test_node.properties["image"]
 
+    def test_get_with_prefetched_links(self, api_test_node):
+        _links = [Link(**_l) for _l in links_data()]
+        api_test_node.get(prefetched_links=_links)
+        assert 1 == len(api_test_node.links)
+        assert "ethernet" == api_test_node.links[0].link_type
+
     def test_get_links(self, api_test_node):
         api_test_node.get_links()
         assert "ethernet" == api_test_node.links[0].link_type
@@ -1206,6 +1359,21 @@ class TestProject:
         with pytest.raises(ValueError, match="status must be opened or closed"):
             Project(status="dummy")
 
+    def test_deepcopy(self, gns3_server):
+        project = Project(project_id=CPROJECT["id"], connector=gns3_server)
+        project.get()
+        project_copy = copy.deepcopy(project)
+        assert project_copy.connector is not gns3_server
+        assert project_copy.connector._lock is not gns3_server._lock
+        assert [n.name for n in project.nodes] == [n.name for n in project_copy.nodes]
+        assert project_copy.connector.get_version()["version"] == "2.2.0"
+
+    def test_pickle_connector(self):
+        server = Gns3Connector(url="http://gns3server:3080")
+        server_copy = pickle.loads(pickle.dumps(server))
+        assert "http://gns3server:3080/v2" == server_copy.base_url
+        assert server_copy._lock is not server._lock
+
     def test_create(self, gns3_server):
         api_test_project = Project(name="API_TEST", connector=gns3_server)
         api_test_project.create()
@@ -1241,6 +1409,25 @@ class TestProject:
             "snapshots": 2,
         } == api_test_project.stats
 
+    def test_get_by_name_cached_id(self):
+        server = Gns3ConnectorMock(url=BASE_URL)
+        Project(name="API_TEST", connector=server).get(
+            get_links=False, get_nodes=False, get_stats=False
+        )
+        assert server.api_calls == 2
+        project = Project(name="API_TEST", connector=server)
+        project.get(get_links=False, get_nodes=False, get_stats=False)
+        assert server.api_calls == 3
+        assert CPROJECT["id"] == project.project_id
+
+    def test_get_by_name_cached_id_expired(self):
+        server = Gns3ConnectorMock(url=BASE_URL, cache_ttl=0)
+        for _ in range(2):
+            Project(name="API_TEST", connector=server).get(
+                get_links=False, get_nodes=False, get_stats=False
+            )
+        assert server.api_calls == 4
+
     @pytest.mark.parametrize(
         "params,expected",
         [
@@ -1305,6 +1492,33 @@ class TestProject:
             assert n[0] == api_test_project.nodes[index].name
             assert n[1] == api_test_project.nodes[index].node_type
 
+    def test_get_nodes_not_modified(self):
+        server = Gns3ConnectorMock(url=BASE_URL)
+        project = Project(project_id=CPROJECT["id"], connector=server)
+        server.adapter.register_uri(
+            "GET",
+            f"{BASE_URL}/v2/projects/{CPROJECT['id']}/nodes",
+            [
+                {"json": nodes_data(), "headers": {"ETag": '"v1"'}},
+                {"status_code": 304},
+            ],
+        )
+        project.get_nodes()
+        _nodes = project.nodes
+        project.get_nodes()
+        assert '"v1"' == server.adapter.last_request.headers["If-None-Match"]
+        assert _nodes is project.nodes
+        assert "alpine-1" == project.get_node(node_id=CNODE["id"]).name
+
+    def test_get_nodes_with_links(self, api_test_project):
+        _calls = api_test_project.connector.api_calls
+        api_test_project.get_nodes(get_links=True)
+        assert api_test_project.connector.api_calls - _calls == 2
+        alpine = api_test_project.get_node(name="alpine-1")
+        assert len(alpine.links) == 1
+        assert "ethernet" == alpine.links[0].link_type
+        assert all(isinstance(n.links, list) for n in api_test_project.nodes)
+
     def test_arrange_nodes_circular(self, api_test_project):
         api_test_project.arrange_nodes_circular()
         for node in api_test_project.nodes:
@@ -1312,7 +1526,7 @@ class TestProject:
             assert node.y != 0
 
     def test_error_get_node_no_required_params(self, api_test_project):
-        with pytest.raises(ValueError, match="name or node_ide must be provided"):
+        with pytest.raises(ValueError, match="name or node_id must be provided"):
             api_test_project.get_node()
 
     def test_get_links(self, api_test_project):
@@ -1329,6 +1543,19 @@ class TestProject:
         for node in api_test_project.nodes:
             assert node.status == "started"
 
+    def test_wait_for_nodes_status_backoff(self, monkeypatch, api_test_project):
+        _clock = [0.0]
+        _sleeps = []
+
+        def _sleep(secs):
+            _sleeps.append(secs)
+            _clock[0] += secs
+
+        monkeypatch.setattr("gns3fy.gns3fy.time.monotonic", lambda: _clock[0])
+        monkeypatch.setattr("gns3fy.gns3fy.time.sleep", _sleep)
+        api_test_project._wait_for_nodes_status("stopped", 2)
+        assert pytest.approx([0.1, 0.2, 0.4, 0.8, 0.5]) == _sleeps
+
     def test_stop_nodes(self):
         project = Project(
             name="API_TEST",
@@ -1339,6 +1566,23 @@ class TestProject:
         for node in project.nodes:
             assert node.status == "stopped"
 
+    def test_stop_nodes_with_builtin_nodes(self, monkeypatch):
+        _sleeps = []
+        monkeypatch.setattr("gns3fy.gns3fy.time.sleep", _sleeps.append)
+        server = Gns3ConnectorMock(url=BASE_URL)
+        _nodes = nodes_data()
+        for n in _nodes:
+            if n["node_type"] not in ("cloud", "ethernet_switch"):
+                n.update(status="stopped")
+        server.adapter.register_uri(
+            "GET", f"{server.base_url}/projects/{CPROJECT['id']}/nodes", json=_nodes
+        )
+        project = Project(project_id=CPROJECT["id"], connector=server)
+        project.stop_nodes(poll_wait_time=5)
+        # Cloud and switch nodes always report started, so they are not waited on
+        assert _sleeps == []
+        assert {"started", "stopped"} == {n.status for n in project.nodes}
+
     def test_reload_nodes(self, api_test_project):
         api_test_project.reload_nodes(poll_wait_time=0)
         for node in api_test_project.nodes:
@@ -1354,6 +1598,18 @@ class TestProject:
         for node in project.nodes:
             assert node.status == "suspended"
 
+    def test_suspend_nodes_keeps_node_objects(self):
+        project = Project(
+            name="API_TEST",
+            connector=Gns3ConnectorMockSuspended(url=BASE_URL),
+            project_id=CPROJECT["id"],
+        )
+        project.get_nodes()
+        nodes = list(project.nodes)
+        project.suspend_nodes(poll_wait_time=0)
+        assert all(a is b for a, b in zip(nodes, project.nodes))
+        assert all(node.status == "suspended" for node in nodes)
+
     def test_nodes_summary(self, api_test_project):
         nodes_summary = api_test_project.nodes_summary(is_print=False)
         assert str(nodes_summary) == (
@@ -1427,6 +1683,12 @@ class TestProject:
         assert host.status == "started"
         assert host.console == 5005
 
+    def test_get_node_by_name_after_rename(self, api_test_project):
+        host = api_test_project.get_node(name="alpine-1")
+        host.name = "alpine-renamed"
+        assert api_test_project.get_node(name="alpine-1") is None
+        assert host is api_test_project.get_node(name="alpine-renamed")
+
     def test_get_link_by_id(self, api_test_project):
         api_test_project.links = []
         link = api_test_project.get_link(link_id=CLINK["id"])
@@ -1443,6 +1705,38 @@ class TestProject:
         assert alpine2.node_type == "docker"
         assert alpine2.node_id == "NEW_NODE_ID"
 
+    def test_create_nodes(self, api_test_project):
+        api_test_project.nodes = []
+        api_test_project.create_nodes(
+            [
+                dict(name="alpine-2", console=5077, template=CTEMPLATE["name"]),
+                dict(name="alpine-3", console=5077, template=CTEMPLATE["name"]),
+            ]
+        )
+        assert ["alpine-2", "alpine-3"] == [n.name for n in api_test_project.nodes[-2:]]
+        with pytest.raises(ValueError, match="Template dummy not found"):
+            api_test_project.create_nodes([dict(name="alpine-4", template="dummy")])
+
+    def test_create_nodes_templates_fetched_once(self):
+        server = Gns3ConnectorMock(url=BASE_URL)
+
+        def _slow_templates(request, context):
+            # Widen the window in which the other workers would miss the cache
+            time.sleep(0.05)
+            return templates_data()
+
+        server.adapter.register_uri(
+            "GET", f"{server.base_url}/templates", json=_slow_templates
+        )
+        project = Project(project_id=CPROJECT["id"], connector=server, nodes=[])
+        project.create_nodes(
+            [dict(name=f"alpine-{i}", template=CTEMPLATE["name"]) for i in range(6)]
+        )
+        assert 1 == sum(
+            r.method == "GET" and r.path.endswith("/templates")
+            for r in server.adapter.request_history
+        )
+
     def test_create_link(self, api_test_project):
         api_test_project.nodes = []
         api_test_project.links = []
@@ -1467,6 +1761,37 @@ class TestProject:
         with pytest.raises(ValueError, match="port_b: Etherne not found"):
             api_test_project.delete_link("IOU1", "Ethernet1/1", "vEOS", "Etherne")
 
+    def test_get_node_after_replacing_node(self, gns3_server):
+        project = Project(name="API_TEST", connector=gns3_server)
+        project.get()
+        assert project.get_node(name="alpine-1") is not None
+        # Same list and length as when the name index was built
+        old_node = next(n for n in project.nodes if n.name == "alpine-1")
+        project.nodes.remove(old_node)
+        project.nodes.append(Node(name="alpine-2", connector=gns3_server))
+        assert project.get_node(name="alpine-1") is None
+        assert "alpine-2" == project.get_node(name="alpine-2").name
+
+    def test_delete_link_after_replacing_link(self, gns3_server):
+        api_test_project = Project(name="API_TEST", connector=gns3_server)
+        api_test_project.get()
+        links = api_test_project.links
+        with pytest.raises(ValueError, match="At least one port is used"):
+            api_test_project.create_link("IOU1", "Ethernet1/0", "IOU2", "Ethernet1/0")
+        # Same list and length as when the endpoint index was built
+        old_link = links.pop(1)
+        links.append(
+            Link(
+                link_id="NEW_LINK_ID",
+                project_id=old_link.project_id,
+                connector=old_link.connector,
+                nodes=old_link.nodes,
+            )
+        )
+        api_test_project.delete_link("IOU1", "Ethernet1/0", "IOU2", "Ethernet1/0")
+        assert api_test_project.get_link(link_id="NEW_LINK_ID") is None
+        assert links is api_test_project.links
+
     @pytest.mark.parametrize(
         "link,expected",
         [
@@ -1569,6 +1894,23 @@ class TestProject:
         assert api_test_project.drawings[0]["drawing_id"] == CDRAWING["id"]
         assert api_test_project.drawings[0]["project_id"] == api_test_project.project_id
 
+    def test_get_drawings_not_modified(self):
+        server = Gns3ConnectorMock(url=BASE_URL)
+        project = Project(project_id=CPROJECT["id"], connector=server)
+        server.adapter.register_uri(
+            "GET",
+            f"{BASE_URL}/v2/projects/{CPROJECT['id']}/drawings",
+            [
+                {"json": projects_drawings_data(), "headers": {"ETag": '"v1"'}},
+                {"status_code": 304},
+            ],
+        )
+        project.get_drawings()
+        _drawings = project.drawings
+        project.get_drawings()
+        assert '"v1"' == server.adapter.last_request.headers["If-None-Match"]
+        assert _drawings is project.drawings
+
     def test_error_get_drawing_not_found(self, api_test_project):
         dummy = api_test_project.get_drawing(drawing_id="dummy")
         assert dummy is None
@@ -1601,6 +1943,28 @@ class TestProject:
         assert drawing["y"] == 20
         assert drawing["z"] == 0
 
+    def test_create_drawings(self, api_test_project):
+        api_test_project.get_drawings()
+        _total = len(api_test_project.drawings)
+        api_test_project.create_drawings(
+            [dict(svg="<svg>1</svg>"), dict(svg="<svg>2</svg>", x=10, y=20)]
+        )
+        assert ["<svg>1</svg>", "<svg>2</svg>"] == [
+            d["svg"] for d in api_test_project.drawings[_total:]
+        ]
+
+    def test_create_drawing_not_loaded(self, gns3_server):
+        project = Project(project_id=CPROJECT["id"], connector=gns3_server)
+        project.create_drawing(svg="<svg>1</svg>")
+        assert CDRAWING["id"] == project.drawings[0]["drawing_id"]
+        assert "<svg>1</svg>" == project.drawings[-1]["svg"]
+
+    def test_create_drawings_not_loaded(self, gns3_server):
+        project = Project(project_id=CPROJECT["id"], connector=gns3_server)
+        project.create_drawings([dict(svg="<svg>1</svg>")])
+        assert CDRAWING["id"] == project.drawings[0]["drawing_id"]
+        assert "<svg>1</svg>" == project.drawings[-1]["svg"]
+
     def test_update_drawing(self, api_test_project):
         api_test_project.get_drawings()
 
@@ -1614,8 +1978,18 @@ class TestProject:
         assert api_test_project.drawings[0]["drawing_id"] == CDRAWING["id"]
 
     def test_delete_drawing(self, api_test_project):
+        _calls = api_test_project.connector.api_calls
         response = api_test_project.delete_drawing(drawing_id=CDRAWING["id"])
         assert response is None
+        assert api_test_project.connector.api_calls - _calls == 2
+        assert api_test_project.get_drawing(drawing_id=CDRAWING["id"]) is None
+
+    def test_delete_drawings(self, api_test_project):
+        with pytest.raises(ValueError, match="drawing not found"):
+            api_test_project.delete_drawings([CDRAWING["id"], "dummy"])
+        assert api_test_project.get_drawing(drawing_id=CDRAWING["id"]) is not None
+        api_test_project.delete_drawings([CDRAWING["id"], CDRAWING["id"]])
+        assert api_test_project.get_drawing(drawing_id=CDRAWING["id"]) is None
 
     def test_delete_drawing_not_found(self, api_test_project):
         with pytest.raises(ValueError, match="drawing not found"):